@@ -2,20 +2,30 @@
 from __future__ import annotations
 
 import argparse
-import threading
+import asyncio
 import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from tspi_kit.commands import (
     COMMAND_SUBJECT_PREFIX,
+    CommandPayload,
     CommandSender,
+    OpsControlCommand,
     OpsControlSender,
 )
 from tspi_kit.commands import OPS_CONTROL_SUBJECT
 from tspi_kit.jetstream_client import JetStreamConsumerAdapter, JetStreamThreadedClient
 from tspi_kit.tags import TagPayload, TagSender
-from tspi_kit.ui.command_console import ClientPresence, ClientPresenceTracker, OperatorEvent
+from tspi_kit.ui.command_console import (
+    ClientPresence,
+    ClientPresenceTracker,
+    OperatorEvent,
+    decode_status_payload,
+)
 from tspi_kit.ui.flet_app import _ensure_flet, pick_flet_web_port
 from tspi_kit.ui.player import connect_in_memory
 from tspi_kit.ui.signals import Signal
@@ -28,10 +38,69 @@ _COLOR_CHOICES: Sequence[tuple[str, str]] = (
     ("Magenta", "#ff00ff"),
     ("Yellow", "#ffff00"),
 )
+_COLOR_OPTIONS: Sequence[tuple[str, str]] = tuple(
+    (value, f"{name} ({value})") for name, value in _COLOR_CHOICES
+)
+_CLIENT_TABLE_COLUMN_LABELS: Sequence[str] = (
+    "Client",
+    "Streaming Channel",
+    "Status",
+    "Connected",
+    "Last Seen",
+    "Operator",
+    "Ping (ms)",
+)
+
 
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%SZ"
+_LOG_LIMIT = 500
+_LOG_SEPARATOR = " — "
 
+
+@lru_cache(maxsize=4096)
 def _format_timestamp(value: datetime) -> str:
-    return value.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%SZ")
+    # Presence timestamps repeat across refreshes (connection_ts rarely
+    # changes), so the converted string is memoised per datetime. The format
+    # is fixed ASCII, so an f-string over the fields beats ``strftime`` and
+    # tracker timestamps are already UTC, skipping ``astimezone``.
+    if value.tzinfo is not UTC:
+        value = value.astimezone(UTC)
+    return (
+        f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+        f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}Z"
+    )
+
+
+def _format_now() -> str:
+    # ``time.strftime`` on a ``struct_time`` avoids building an aware datetime.
+    return time.strftime(_TIMESTAMP_FORMAT, time.gmtime())
+
+
+# Raw status payload paired with its decoded form (``None`` if undecodable).
+StatusRecord = Tuple[bytes, Optional[Dict[str, Any]]]
+
+
+def _presence_cells(presence: ClientPresence) -> tuple[str, ...]:
+    """Return the client table cell strings for *presence*, in column order."""
+
+    return (
+        presence.client_id,
+        presence.channel_display,
+        presence.state_display,
+        _format_timestamp(presence.connection_ts),
+        _format_timestamp(presence.last_seen_ts),
+        presence.operator or "",
+        f"{presence.ping_ms:.1f}" if presence.ping_ms is not None else "",
+    )
+
+
+@dataclass(slots=True)
+class _ClientRow:
+    """Client table row kept alive across refreshes and updated in place."""
+
+    presence: ClientPresence
+    row: Any
+    texts: List[Any]
 
 
 class CommandController:
@@ -54,40 +123,92 @@ class CommandController:
         self._sender = sender
         self._ops_sender = ops_sender
         self._tag_sender = tag_sender
+        # Queued ``(subject, payload, status, replay_channel)`` entries; the
+        # replay channel is ``None`` for display commands.
+        self._pending: List[
+            tuple[str, CommandPayload | OpsControlCommand, str, str | None]
+        ] = []
 
     @property
     def tagging_enabled(self) -> bool:
         return self._tag_sender is not None
 
-    def set_units(self, units: str) -> None:
+    def set_units(self, units: str, *, defer: bool = False) -> None:
         try:
-            payload = self._sender.send_units(units)
+            subject, payload = self._sender.units_command(units)
         except Exception as exc:
             self.error_occurred.emit(str(exc))
             return
-        self.status_changed.emit(f"Units set to {payload.payload['units']}")
+        self._queue(subject, payload, f"Units set to {payload.payload['units']}", defer)
 
-    def set_marker_color(self, color: str) -> None:
+    def set_marker_color(self, color: str, *, defer: bool = False) -> None:
         try:
-            payload = self._sender.send_marker_color(color)
+            subject, payload = self._sender.marker_color_command(color)
         except Exception as exc:
             self.error_occurred.emit(str(exc))
             return
-        self.status_changed.emit(f"Marker color set to {payload.payload['marker_color']}")
+        self._queue(
+            subject, payload, f"Marker color set to {payload.payload['marker_color']}", defer
+        )
 
-    def set_session_metadata(self, name: str, identifier: str) -> None:
+    def set_session_metadata(self, name: str, identifier: str, *, defer: bool = False) -> None:
         try:
-            payload = self._sender.send_session_metadata(name, identifier)
+            subject, payload = self._sender.session_metadata_command(name, identifier)
         except Exception as exc:
             self.error_occurred.emit(str(exc))
             return
         details = payload.payload.get("session_metadata", {})
         session_name = details.get("name", name)
         session_id = details.get("id", identifier)
-        self.status_changed.emit(
-            f"Session metadata set to {session_name} ({session_id})"
+        self._queue(
+            subject, payload, f"Session metadata set to {session_name} ({session_id})", defer
         )
 
+    def _queue(
+        self,
+        subject: str,
+        payload: CommandPayload | OpsControlCommand,
+        status: str,
+        defer: bool,
+        *,
+        replay_channel: str | None = None,
+    ) -> None:
+        self._pending.append((subject, payload, status, replay_channel))
+        if not defer:
+            self.flush()
+
+    def flush(self) -> None:
+        """Publish every queued command in one batch.
+
+        ``set_*`` and group replay calls made with ``defer=True`` only queue
+        their command, so several of them cost a single
+        :meth:`CommandSender.send_batch`. Queued replay commands move the
+        active replay channel only once the batch has been sent; a failed
+        batch leaves it where it was.
+        """
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            self._sender.send_batch([(subject, payload) for subject, payload, _, _ in pending])
+        except Exception as exc:
+            self.error_occurred.emit(str(exc))
+            return
+        for _, payload, status, replay_channel in pending:
+            if replay_channel is not None:
+                self._ops_sender.commit(payload)
+                self.group_replay_changed.emit(replay_channel)
+            self.status_changed.emit(status)
+
+    def _pending_channel(self) -> str | None:
+        # A stop without an explicit channel targets the replay the queue will
+        # leave active, which may be a start that has not been sent yet.
+        for _, _, _, replay_channel in reversed(self._pending):
+            if replay_channel is not None:
+                return replay_channel or None
+        return self._ops_sender.active_channel_id
+
     def create_tag(self, timestamp: datetime, comment: str) -> TagPayload | None:
         if self._tag_sender is None:
             self.error_occurred.emit("Tagging is not configured")
@@ -108,9 +229,10 @@ class CommandController:
         *,
         stream: str,
         display_name: str | None = None,
+        defer: bool = False,
     ) -> None:
         try:
-            message = self._ops_sender.start_group_replay(
+            subject, command = self._ops_sender.start_group_replay_command(
                 identifier,
                 stream=stream,
                 display_name=display_name,
@@ -118,73 +240,235 @@ class CommandController:
         except Exception as exc:
             self.error_occurred.emit(str(exc))
             return
-        channel = message.channel
-        self.group_replay_changed.emit(channel.channel_id)
-        self.status_changed.emit(f"Group replay started on {channel.display_name}")
+        channel = command.message.channel
+        self._queue(
+            subject,
+            command,
+            f"Group replay started on {channel.display_name}",
+            defer,
+            replay_channel=channel.channel_id,
+        )
 
-    def stop_group_replay(self, channel_id: str | None) -> None:
+    def stop_group_replay(self, channel_id: str | None, *, defer: bool = False) -> None:
         try:
-            message = self._ops_sender.stop_group_replay(channel_id)
+            subject, command = self._ops_sender.stop_group_replay_command(
+                channel_id or self._pending_channel()
+            )
         except Exception as exc:
             self.error_occurred.emit(str(exc))
             return
-        self.group_replay_changed.emit("")
-        self.status_changed.emit(f"Group replay stopped on {message.channel_id}")
+        self._queue(
+            subject,
+            command,
+            f"Group replay stopped on {command.message.channel_id}",
+            defer,
+            replay_channel="",
+        )
 
 
 class StatusPoller:
-    """Background helper that polls JetStream status updates."""
+    """Poll JetStream status updates from a task on the UI event loop.
+
+    :meth:`run` is a coroutine meant to be scheduled with ``page.run_task`` so
+    that batches are delivered on the Flet loop without any cross-thread
+    hand-off; only the blocking consumer ``pull`` runs in a worker thread.
+
+    The pull size adapts to traffic: it doubles (up to ``max_batch``) while
+    pulls come back full and halves (down to ``min_batch``) when they come
+    back empty. Consecutive empty pulls also back the poll interval off
+    exponentially up to ``max_interval``; any delivered message resets it.
+    Idle waits are interruptible: :meth:`poke` triggers the next pull right
+    away when the caller knows status traffic is imminent.
+    """
 
     def __init__(
         self,
         consumer: JetStreamConsumerAdapter,
         *,
         poll_interval: float = 0.5,
-        batch: int = 32,
-        on_message: callable[[bytes], None],
-        on_error: callable[[str], None],
+        batch: int = 256,
+        min_batch: int = 1,
+        max_batch: int = 1024,
+        max_interval: float = 2.0,
+        on_batch: Callable[[List[StatusRecord]], None],
+        on_error: Callable[[str], None],
     ) -> None:
         self._consumer = consumer
         self._interval = max(0.05, float(poll_interval))
-        self._batch = max(1, int(batch))
-        self._on_message = on_message
+        self._max_interval = max(self._interval, float(max_interval))
+        self._min_batch = max(1, int(min_batch))
+        self._max_batch = max(self._min_batch, int(max_batch))
+        self._batch = min(self._max_batch, max(self._min_batch, int(batch)))
+        self._cur_batch = self._batch
+        self._cur_interval = self._interval
+        self._on_batch = on_batch
         self._on_error = on_error
-        self._stop = threading.Event()
-        self._thread: threading.Thread | None = None
-
-    def start(self) -> None:
-        if self._thread and self._thread.is_alive():
-            return
-        self._stop.clear()
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self._stopped = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
 
     def stop(self) -> None:
-        self._stop.set()
-        if self._thread is not None:
-            self._thread.join(timeout=1.0)
-            self._thread = None
-
-    def _run(self) -> None:
-        while not self._stop.is_set():
-            try:
-                messages = self._consumer.pull(self._batch)
-            except Exception as exc:  # pragma: no cover - diagnostics only
-                self._on_error(str(exc))
-                time.sleep(self._interval)
-                continue
-            if not messages:
-                time.sleep(self._interval)
-                continue
-            for message in messages:
-                data = getattr(message, "data", None)
-                if data is None:
-                    continue
+        """Ask :meth:`run` to return once any pull in flight is delivered.
+
+        Status consumers do not wait for acks, so a pull that has started has
+        already taken its messages off the consumer; they are handed to
+        ``on_batch`` rather than dropped.
+        """
+
+        self._stopped = True
+        self._signal_wake()
+
+    def poke(self) -> None:
+        """Cut the current idle wait short and poll at the base interval."""
+
+        self._cur_interval = self._interval
+        self._signal_wake()
+
+    def _signal_wake(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wake.set()
+        else:
+            loop.call_soon_threadsafe(wake.set)
+
+    async def _idle(self, wake: asyncio.Event) -> None:
+        delay = self._cur_interval
+        self._cur_interval = min(self._max_interval, delay * 2)
+        # Arm a plain loop timer on the wake event rather than ``wait_for``,
+        # which wraps every idle period in a fresh task and timeout.
+        timer = asyncio.get_running_loop().call_later(delay, wake.set)
+        try:
+            await wake.wait()
+        finally:
+            timer.cancel()
+        wake.clear()
+
+    def _pull(self, size: int) -> tuple[int, List[StatusRecord]]:
+        """Pull and decode one batch; runs in a worker thread, off the UI loop."""
+
+        messages = self._consumer.pull(size)
+        # Both the NATS and in-memory consumers deliver ``bytes`` data, so the
+        # payload is used as-is and each message attribute is read only once.
+        decode = decode_status_payload
+        records = [
+            (data, decode(data))
+            for message in messages
+            if (data := message.data) is not None
+        ]
+        return len(messages), records
+
+    async def run(self) -> None:
+        self._loop = loop = asyncio.get_running_loop()
+        self._wake = wake = asyncio.Event()
+        self._stopped = False
+        self._cur_batch = self._batch
+        self._cur_interval = self._interval
+        prefetch: Optional[asyncio.Future] = None
+        try:
+            # A prefetch already in flight is always awaited, even after
+            # ``stop()``, so the messages it took are delivered, not lost.
+            while not self._stopped or prefetch is not None:
+                size = self._cur_batch
+                pull = prefetch or loop.run_in_executor(None, self._pull, size)
+                prefetch = None
                 try:
-                    payload = bytes(data)
-                except Exception:
+                    pulled, records = await pull
+                except Exception as exc:  # pragma: no cover - diagnostics only
+                    self._on_error(str(exc))
+                    if not self._stopped:
+                        await self._idle(wake)
+                    continue
+                if not pulled:
+                    self._cur_batch = max(self._min_batch, size // 2)
+                    if not self._stopped:
+                        await self._idle(wake)
                     continue
-                self._on_message(payload)
+                self._cur_interval = self._interval
+                if pulled >= size:
+                    self._cur_batch = min(self._max_batch, size * 2)
+                # More messages are likely queued behind a non-empty pull, so
+                # request them before handing this batch to the UI; the broker
+                # round trip then overlaps with rendering instead of following it.
+                if not self._stopped:
+                    prefetch = loop.run_in_executor(None, self._pull, self._cur_batch)
+                if records:
+                    # Hand the whole pull to the UI at once so a burst costs a
+                    # single page update instead of one per message.
+                    self._on_batch(records)
+        finally:
+            self._loop = None
+            self._wake = None
+
+
+class StatusBroker:
+    """Share one :class:`StatusPoller` between every console on a consumer.
+
+    Pull consumers hand each message to a single caller, so consoles polling
+    the same consumer would split the status stream between them. The broker
+    runs one poller while at least one console is subscribed and re-emits
+    every batch to all of them through :class:`Signal` fan-out.
+    """
+
+    def __init__(self, consumer: JetStreamConsumerAdapter, **poller_options: Any) -> None:
+        self.batch_received = Signal[List[StatusRecord]]()
+        self.error_occurred = Signal[str]()
+        self._consumer = consumer
+        self._poller_options = poller_options
+        self._poller: StatusPoller | None = None
+        self._subscribers = 0
+
+    def subscribe(
+        self,
+        on_batch: Callable[[List[StatusRecord]], None],
+        on_error: Callable[[str], None],
+        *,
+        run_task: Callable[..., Any],
+    ) -> None:
+        """Register a console; the first subscriber starts polling via *run_task*."""
+
+        self.batch_received.connect(on_batch)
+        self.error_occurred.connect(on_error)
+        self._subscribers += 1
+        if self._poller is None:
+            # A fresh poller per start keeps a cancelled run from sharing
+            # state with its successor.
+            self._poller = StatusPoller(
+                self._consumer,
+                on_batch=self.batch_received.emit,
+                on_error=self.error_occurred.emit,
+                **self._poller_options,
+            )
+            run_task(self._poller.run)
+
+    def unsubscribe(
+        self,
+        on_batch: Callable[[List[StatusRecord]], None],
+        on_error: Callable[[str], None],
+    ) -> None:
+        """Remove a console; polling stops once nobody is subscribed."""
+
+        self.batch_received.disconnect(on_batch)
+        self.error_occurred.disconnect(on_error)
+        self._subscribers = max(0, self._subscribers - 1)
+        if self._subscribers == 0:
+            self.stop()
+
+    def poke(self) -> None:
+        if self._poller is not None:
+            self._poller.poke()
+
+    def stop(self) -> None:
+        # The poller's task is left to finish rather than cancelled, so it
+        # can deliver any pull still in flight before it returns.
+        if self._poller is not None:
+            self._poller.stop()
+            self._poller = None
 
 
 class CommandConsoleApp:
@@ -196,6 +480,7 @@ class CommandConsoleApp:
         controller: CommandController,
         *,
         status_consumer: JetStreamConsumerAdapter | None = None,
+        status_broker: StatusBroker | None = None,
         default_replay_stream: str = "TSPI",
     ) -> None:
         self._ft = _ensure_flet()
@@ -203,28 +488,30 @@ class CommandConsoleApp:
         self.controller = controller
         self._tracker = ClientPresenceTracker()
         self._pending_tag_timestamp: datetime | None = None
-        self._poller: StatusPoller | None = None
+        if status_broker is None and status_consumer is not None:
+            status_broker = StatusBroker(status_consumer)
+        self._status_broker = status_broker
         self._clients: Dict[str, ClientPresence] = {}
+        self._client_rows: Dict[str, _ClientRow] = {}
+        self._latest_status: Dict[bytes, str] = {}
+        self._latest_status_by_client: Dict[str, bytes] = {}
+        self._log_buffer: deque[Any] = deque(maxlen=_LOG_LIMIT)
+        self._update_scheduled = False
+        self._full_update = False
+        self._dirty_controls: List[Any] = []
         self._active_channel: str | None = None
         self._default_replay_stream = default_replay_stream
         self._status_color = self._ft.colors.ON_SURFACE
         self._build_controls()
         self._connect_signals()
-        if status_consumer is not None:
-            self._poller = StatusPoller(
-                status_consumer,
-                on_message=lambda payload: self._run_on_page(
-                    lambda: self._handle_status_payload(payload, update=False)
-                ),
-                on_error=lambda message: self._run_on_page(
-                    lambda: self._append_log(
-                        f"Status poller error: {message}",
-                        color=self._ft.colors.RED,
-                        update=False,
-                    )
-                ),
+        if status_broker is not None:
+            # Polling runs as a task on the page's event loop, so batches are
+            # applied directly instead of being trampolined from a thread.
+            status_broker.subscribe(
+                self._on_status_batch, self._on_status_error, run_task=self.page.run_task
             )
-            self._poller.start()
+            # Replay commands make every client publish a status change.
+            self.controller.group_replay_changed.connect(self._poke_status_broker)
 
     # ------------------------------------------------------------------ UI setup
 
@@ -240,7 +527,7 @@ class CommandConsoleApp:
         )
         self.color_dropdown = ft.Dropdown(
             label="Marker Color",
-            options=[ft.dropdown.Option(key=value, text=f"{name} ({value})") for name, value in _COLOR_CHOICES],
+            options=[ft.dropdown.Option(key=value, text=text) for value, text in _COLOR_OPTIONS],
         )
         self.session_name = ft.TextField(label="Session Name", hint_text="e.g. Falcon Lead")
         self.session_id = ft.TextField(label="Session ID", hint_text="e.g. 42")
@@ -287,15 +574,7 @@ class CommandConsoleApp:
 
         # Client table
         self.client_table = ft.DataTable(
-            columns=[
-                ft.DataColumn(ft.Text("Client")),
-                ft.DataColumn(ft.Text("Streaming Channel")),
-                ft.DataColumn(ft.Text("Status")),
-                ft.DataColumn(ft.Text("Connected")),
-                ft.DataColumn(ft.Text("Last Seen")),
-                ft.DataColumn(ft.Text("Operator")),
-                ft.DataColumn(ft.Text("Ping (ms)")),
-            ],
+            columns=[ft.DataColumn(ft.Text(label)) for label in _CLIENT_TABLE_COLUMN_LABELS],
             rows=[],
         )
 
@@ -349,78 +628,198 @@ class CommandConsoleApp:
 
     # ------------------------------------------------------------------ UI helpers
 
+    def _poke_status_broker(self, _channel: str) -> None:
+        if self._status_broker is not None:
+            self._status_broker.poke()
+
     def _update_status(self, message: str) -> None:
         self.status_text.value = message
         self.status_text.color = self._status_color
         self._append_log(message)
-        self.page.update()
+        self._schedule_update(self.status_text)
 
     def _show_error(self, message: str) -> None:
         self.status_text.value = message
         self.status_text.color = self._ft.colors.RED
         self._append_log(f"ERROR: {message}", color=self._ft.colors.RED)
-        self.page.update()
+        self._schedule_update(self.status_text)
 
     def _set_active_channel(self, channel: str) -> None:
         self._active_channel = channel or None
         self.active_channel.value = channel
         if not channel:
             self.active_channel.value = ""
-        self.page.update()
+        self._schedule_update(self.active_channel)
 
-    def _run_on_page(self, handler: Callable[[], None]) -> None:
-        async def _runner() -> None:
-            handler()
-            await self.page.update_async()
+    def _schedule_update(self, *controls: Any) -> None:
+        """Coalesce control updates requested during one event-loop tick.
 
-        self.page.run_task(_runner)
+        Status batches, signal handlers and UI callbacks mark the controls they
+        touched; once the current tick is done a single ``page.update`` sends
+        just those controls (or the whole page when called without any).
+        Outside a running loop the update is applied immediately.
+        """
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.page.update(*controls)
+            return
+        if controls:
+            dirty = self._dirty_controls
+            for control in controls:
+                if not any(control is existing for existing in dirty):
+                    dirty.append(control)
+        else:
+            self._full_update = True
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            loop.call_soon(self._flush_update)
+
+    def _flush_update(self) -> None:
+        controls, self._dirty_controls = self._dirty_controls, []
+        full, self._full_update = self._full_update, False
+        self._update_scheduled = False
+        if full:
+            self.page.update()
+        elif controls:
+            self.page.update(*controls)
 
     def _append_log(
         self, message: str, *, color: str | None = None, update: bool = True
     ) -> None:
-        entry = self._ft.Text(f"{_format_timestamp(datetime.now(tz=UTC))} — {message}", color=color)
-        self.log_view.controls.append(entry)
-        if len(self.log_view.controls) > 500:
-            del self.log_view.controls[0 : len(self.log_view.controls) - 500]
+        entry = self._ft.Text(_format_now() + _LOG_SEPARATOR + message, color=color)
+        self._push_log_entries((entry,))
         if update:
-            self.page.update()
+            self._schedule_update(self.log_view)
+
+    def _push_log_entries(self, entries: Sequence[Any]) -> None:
+        """Append *entries* to the log, keeping only the newest ``_LOG_LIMIT``.
+
+        The bounded deque evicts old entries in O(1); ``log_view.controls`` is
+        only rebound (once per call) when that eviction actually happened.
+        """
+
+        buffer = self._log_buffer
+        overflow = len(buffer) + len(entries) > _LOG_LIMIT
+        buffer.extend(entries)
+        if overflow:
+            self.log_view.controls = list(buffer)
+        else:
+            self.log_view.controls.extend(entries)
+
+    def _on_status_error(self, message: str) -> None:
+        self._append_log(f"Status poller error: {message}", color=self._ft.colors.RED)
+
+    def _on_status_batch(self, records: Sequence[StatusRecord]) -> None:
+        self._handle_status_batch(records)
+        self._schedule_update(self.client_table, self.log_view)
+
+    def _handle_status_batch(self, records: Sequence[StatusRecord]) -> None:
+        """Apply a pulled batch of status records; the caller updates the page.
+
+        Records arrive already decoded by the poller's worker thread. A payload
+        byte-identical to the newest status applied for its client is skipped
+        before any tracker work; the comparison is per console, because the
+        poller that decodes is shared through :class:`StatusBroker`.
+        """
+
+        events: List[OperatorEvent] = []
+        clients = self._clients
+        clients_changed = False
+        new_clients = False
+        latest = self._latest_status
+        latest_by_client = self._latest_status_by_client
+        process_payload = self._tracker.process_payload
+        extend_events = events.extend
+        for payload, status in records:
+            if status is None or payload in latest:
+                # Undecodable, or byte-identical to the newest status applied
+                # for its client: a re-delivered heartbeat changes nothing.
+                continue
+            presence, payload_events = process_payload(status)
+            if presence is None:
+                continue
+            client_id = presence.client_id
+            previous_raw = latest_by_client.pop(client_id, None)
+            if previous_raw is not None:
+                latest.pop(previous_raw, None)
+            if status.get("ts"):
+                # Without an explicit timestamp the tracker stamps "now", so
+                # only timestamped payloads are safe to skip when repeated.
+                latest[payload] = client_id
+                latest_by_client[client_id] = payload
+            if client_id not in clients:
+                new_clients = True
+            clients[client_id] = presence
+            clients_changed = True
+            extend_events(payload_events)
+        if new_clients:
+            # ``_clients`` is kept in client-id order so refreshes never sort;
+            # only a batch that introduces a client pays for re-ordering.
+            self._clients = dict(sorted(clients.items()))
+        if clients_changed:
+            self._refresh_clients(update=False)
+        if events:
+            self._append_events(events)
+
+    def _append_events(self, events: Sequence[OperatorEvent]) -> None:
+        text = self._ft.Text
+        # Every event in a batch shares the same receive-time prefix.
+        prefix = _format_now() + _LOG_SEPARATOR
+        self._push_log_entries(
+            [
+                text(prefix + _format_timestamp(event.timestamp) + _LOG_SEPARATOR + event.message)
+                for event in events
+            ]
+        )
 
-    def _handle_status_payload(self, payload: bytes, *, update: bool = True) -> None:
-        presence, events = self._tracker.process_raw(payload)
-        if presence is not None:
-            self._clients[presence.client_id] = presence
-            self._refresh_clients(update=update)
-        for event in events:
-            self._append_event(event, update=update)
+    def _refresh_clients(self, *, update: bool = True) -> None:
+        """Sync the client table with ``self._clients``.
 
-    def _append_event(self, event: OperatorEvent, *, update: bool = True) -> None:
-        timestamp = _format_timestamp(event.timestamp)
-        self._append_log(f"{timestamp} — {event.message}", update=update)
+        Rows are built once per client and their ``Text`` values are updated
+        in place afterwards; the row list itself is only rebuilt, in the
+        (already sorted) ``_clients`` order, when clients appear or disappear.
+        The page is updated only if a displayed cell actually changed.
+        """
 
-    def _refresh_clients(self, *, update: bool = True) -> None:
-        rows = []
         ft = self._ft
-        for presence in sorted(self._clients.values(), key=lambda item: item.client_id):
-            rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(presence.client_id)),
-                        ft.DataCell(ft.Text(presence.channel_display)),
-                        ft.DataCell(ft.Text(presence.state_display)),
-                        ft.DataCell(ft.Text(_format_timestamp(presence.connection_ts))),
-                        ft.DataCell(ft.Text(_format_timestamp(presence.last_seen_ts))),
-                        ft.DataCell(ft.Text(presence.operator or "")),
-                        ft.DataCell(
-                            ft.Text(
-                                f"{presence.ping_ms:.1f}" if presence.ping_ms is not None else ""
-                            )
-                        ),
-                    ]
-                )
-            )
-        self.client_table.rows = rows
-        if update:
-            self.page.update()
+        text_cls, cell_cls, row_cls = ft.Text, ft.DataCell, ft.DataRow
+        clients = self._clients
+        cache = self._client_rows
+        cached_row = cache.get
+        dirty = False
+        membership_changed = False
+        for client_id, presence in clients.items():
+            cached = cached_row(client_id)
+            if cached is None:
+                texts = [text_cls(value) for value in _presence_cells(presence)]
+                row = row_cls(cells=[cell_cls(text) for text in texts])
+                cache[client_id] = _ClientRow(presence, row, texts)
+                membership_changed = True
+            elif cached.presence is not presence and cached.presence != presence:
+                changed = False
+                for text, value in zip(cached.texts, _presence_cells(presence)):
+                    if text.value != value:
+                        text.value = value
+                        changed = True
+                cached.presence = presence
+                if not changed:
+                    # Keep-alive heartbeats usually only move ``last_seen_ts``
+                    # within the displayed second; nothing to repaint.
+                    continue
+            else:
+                continue
+            dirty = True
+        if len(cache) != len(clients):
+            for client_id in cache.keys() - clients.keys():
+                del cache[client_id]
+            membership_changed = True
+        if membership_changed:
+            self.client_table.rows = [cache[client_id].row for client_id in clients]
+            dirty = True
+        if dirty and update:
+            self._schedule_update(self.client_table)
 
     # ------------------------------------------------------------------ Event handlers
 
@@ -450,7 +849,7 @@ class CommandConsoleApp:
         self.tag_comment.disabled = False
         self.tag_comment.value = ""
         self.send_tag_button.disabled = False
-        self.page.update()
+        self._schedule_update(self.tag_timestamp, self.tag_comment, self.send_tag_button)
 
     async def _on_send_tag(self, _event) -> None:
         if not self.controller.tagging_enabled:
@@ -471,7 +870,7 @@ class CommandConsoleApp:
         self.send_tag_button.disabled = True
         self.tag_timestamp.value = "Press Capture to mark timestamp"
         self._pending_tag_timestamp = None
-        self.page.update()
+        self._schedule_update(self.tag_timestamp, self.tag_comment, self.send_tag_button)
 
     async def _on_start_replay(self, _event) -> None:
         identifier = (self.replay_identifier.value or "").strip()
@@ -490,11 +889,14 @@ class CommandConsoleApp:
     # ------------------------------------------------------------------ Lifecycle
 
     def shutdown(self) -> None:
-        if self._poller is not None:
-            self._poller.stop()
+        if self._status_broker is not None:
+            self.controller.group_replay_changed.disconnect(self._poke_status_broker)
+            self._status_broker.unsubscribe(self._on_status_batch, self._on_status_error)
+            self._status_broker = None
 
 
-def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="TSPI Command Console (Flet)")
     parser.add_argument("--headless", action="store_true", help="Run without launching the UI")
     parser.add_argument("--nats-server", dest="nats_servers", action="append", help="NATS server URL (repeatable)")
@@ -521,7 +923,12 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--marker-color", help="Broadcast marker color in headless mode")
     parser.add_argument("--session-name", help="Broadcast session name in headless mode")
     parser.add_argument("--session-id", help="Broadcast session identifier in headless mode")
-    return parser.parse_args(argv)
+    return parser
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    # The parser is built once per process and reused by every call.
+    return _build_parser().parse_args(argv)
 
 
 def _create_status_consumer(
@@ -532,12 +939,16 @@ def _create_status_consumer(
 ) -> Optional[JetStreamConsumerAdapter]:
     try:
         js_client.ensure_stream(ops_stream, [status_subject])
-        return js_client.create_pull_consumer(status_subject, stream=ops_stream)
     except Exception:  # pragma: no cover - stream may already exist without permissions
-        try:
-            return js_client.create_pull_consumer(status_subject, stream=ops_stream)
-        except Exception:
-            return None
+        pass
+    # ``create_pull_consumer`` already retries while the stream appears, so a
+    # failure here is final rather than worth a second full attempt.
+    try:
+        # Status heartbeats are superseded by the next one, so the consumer
+        # runs without acknowledgements.
+        return js_client.create_pull_consumer(status_subject, stream=ops_stream, ack_policy="none")
+    except Exception:  # pragma: no cover - surfaced as "no status updates"
+        return None
 
 
 def main(argv: List[str] | None = None) -> int:
@@ -583,6 +994,7 @@ def main(argv: List[str] | None = None) -> int:
 
     sender = CommandSender(publisher, sender_id=args.sender_id)
     ops_sender = OpsControlSender(publisher, sender_id=args.sender_id)
+    controller = CommandController(sender, ops_sender, tag_sender=tag_sender)
 
     if args.headless:
         requested_metadata = args.session_name or args.session_id
@@ -600,26 +1012,34 @@ def main(argv: List[str] | None = None) -> int:
             raise SystemExit(
                 "Headless mode requires a display command, session metadata, or group replay command"
             )
+        # Queue every requested command and publish them in one batch.
+        errors: List[str] = []
+        controller.error_occurred.connect(errors.append)
         if args.units:
-            sender.send_units(args.units)
+            controller.set_units(args.units, defer=True)
         if args.marker_color:
-            sender.send_marker_color(args.marker_color)
+            controller.set_marker_color(args.marker_color, defer=True)
         if args.session_name and args.session_id:
-            sender.send_session_metadata(args.session_name, args.session_id)
+            controller.set_session_metadata(args.session_name, args.session_id, defer=True)
         if args.group_replay_id:
             stream_name = args.group_replay_stream or args.js_stream
-            ops_sender.start_group_replay(
+            controller.start_group_replay(
                 args.group_replay_id,
                 stream=stream_name,
+                defer=True,
             )
         if args.stop_group_replay is not None:
             channel_id = args.stop_group_replay or None
-            ops_sender.stop_group_replay(channel_id)
+            controller.stop_group_replay(channel_id, defer=True)
+        if not errors:
+            controller.flush()
         if js_client is not None:
             js_client.close()
+        if errors:
+            raise SystemExit("; ".join(errors))
         return 0
 
-    controller = CommandController(sender, ops_sender, tag_sender=tag_sender)
+    status_broker = StatusBroker(status_consumer) if status_consumer is not None else None
     console_holder: Dict[str, CommandConsoleApp] = {}
     ft = _ensure_flet()
 
@@ -627,7 +1047,7 @@ def main(argv: List[str] | None = None) -> int:
         console = CommandConsoleApp(
             page,
             controller,
-            status_consumer=status_consumer,
+            status_broker=status_broker,
             default_replay_stream=args.group_replay_stream or args.js_stream,
         )
         console_holder["app"] = console
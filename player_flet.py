@@ -2,20 +2,19 @@ from __future__ import annotations
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Mapping
 
-import flet as ft
-
 from tspi_kit.jetstream_client import JetStreamThreadedClient
 from tspi_kit.receiver import CompositeTSPIReceiver, TSPIReceiver
 from tspi_kit.tags import TagSender
 from tspi_kit.ui import HeadlessPlayerRunner, UiConfig
-from tspi_kit.ui.flet_app import PlayerViewConfig, mount_player, pick_flet_web_port
 from tspi_kit.ui.player import ReceiverFactory, connect_in_memory
 
 
-def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="JetStream Player (Flet)")
     defaults = UiConfig()
     parser.add_argument("--headless", action="store_true", help="Run without a GUI")
@@ -76,7 +75,12 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default="player-cli",
         help="Prefix for JetStream durable consumer names.",
     )
-    return parser.parse_args(argv)
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    # The parser is built once per process and reused by every call.
+    return _build_parser().parse_args(argv)
 
 
 def _build_sources(
@@ -98,15 +102,17 @@ def _build_sources(
     if nats_servers:
         js_client = JetStreamThreadedClient(nats_servers)
         js_client.start()
-        receivers: dict[str, ReceiverFactory | TSPIReceiver | CompositeTSPIReceiver] = {}
+        specs: list[tuple[str, str, str | None]] = []
         for name, subjects in subject_map.items():
             durable_base = f"{durable_prefix}-{name}"
             stream_name = js_stream if name == "livestream" else historical_stream
-            receiver_list: list[TSPIReceiver] = []
             for index, subject in enumerate(subjects):
-                durable = f"{durable_base}-{index}"
-                consumer = js_client.create_pull_consumer(subject, durable=durable, stream=stream_name)
-                receiver_list.append(TSPIReceiver(consumer))
+                specs.append((subject, f"{durable_base}-{index}", stream_name))
+        # Every consumer is requested in one concurrent batch.
+        consumers = iter(js_client.create_pull_consumers(specs))
+        receivers: dict[str, ReceiverFactory | TSPIReceiver | CompositeTSPIReceiver] = {}
+        for name, subjects in subject_map.items():
+            receiver_list = [TSPIReceiver(next(consumers)) for _ in subjects]
             if len(receiver_list) == 1:
                 receivers[name] = receiver_list[0]
             else:
@@ -161,9 +167,13 @@ def main(argv: list[str] | None = None) -> int:
         cleanup()
         return 0
 
+    # Flet is only needed for the GUI, so headless runs never import it.
+    from tspi_kit.ui.flet_app import PlayerViewConfig, _ensure_flet, mount_player, pick_flet_web_port
+
+    ft = _ensure_flet()
     view_config = PlayerViewConfig(ui=config, initial_source=args.source, tag_sender=tag_sender)
 
-    def _launch(page: ft.Page) -> None:
+    def _launch(page) -> None:
         mount_player(page, sources, config=view_config)
 
     ft.app(target=_launch, port=pick_flet_web_port())
@@ -4,16 +4,33 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+import logging.handlers
+import os
+import queue
 import signal
 import sys
+from functools import lru_cache
 from typing import Iterable, Sequence
 
 from nats.aio.client import Client as NATS
 
+try:  # pragma: no cover - optional dependency resolution
+    import uvloop
+except ModuleNotFoundError:  # pragma: no cover - fall back to the stdlib loop
+    uvloop = None  # type: ignore[assignment]
+
 from tspi_kit.producer import TSPIProducer
 from tspi_kit.udp_ingest import AsyncJetStreamPublisher, UDPIngestProtocol
 
+# Signals that stop the producer, resolved once for the running platform.
+_STOP_SIGNALS = tuple(
+    sig
+    for sig in (getattr(signal, "SIGINT", None), getattr(signal, "SIGTERM", None))
+    if sig is not None
+)
+
 
+@lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="UDP TSPI-to-JetStream producer CLI"
@@ -55,6 +72,24 @@ def _build_parser() -> argparse.ArgumentParser:
         default=2.0,
         help="Timeout (seconds) for JetStream publish operations.",
     )
+    parser.add_argument(
+        "--max-inflight",
+        type=int,
+        default=512,
+        help="Maximum number of JetStream publishes awaiting an ack (default: 512)",
+    )
+    parser.add_argument(
+        "--ingest-cpu",
+        type=int,
+        default=None,
+        help="Pin the ingest event loop to this CPU (Linux only).",
+    )
+    parser.add_argument(
+        "--rt-priority",
+        type=int,
+        default=None,
+        help="Run the ingest event loop under SCHED_FIFO at this priority (Linux, needs CAP_SYS_NICE).",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -64,11 +99,51 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-async def _run_async(args: argparse.Namespace) -> int:
-    logging.basicConfig(
-        level=getattr(logging, args.log_level),
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+def _configure_logging(level: str) -> logging.handlers.QueueListener:
+    """Route log records through a queue so the event loop never writes to stderr.
+
+    The returned listener owns the stream handler and must be stopped on exit
+    to flush any queued records.
+    """
+
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
     )
+    queue_handler = logging.handlers.QueueHandler(records)
+    # Attached directly rather than via basicConfig, which would give the
+    # queue handler a formatter of its own; the stream handler's layout is
+    # the only one applied.
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level))
+    root.addHandler(queue_handler)
+    listener = logging.handlers.QueueListener(records, stream_handler)
+    listener.start()
+    return listener
+
+
+def _tune_ingest_thread(ingest_cpu: int | None, rt_priority: int | None) -> None:
+    """Pin and/or prioritise the calling thread, which runs the ingest loop.
+
+    Both settings are best effort: unsupported platforms and missing
+    privileges are logged and otherwise ignored.
+    """
+
+    if ingest_cpu is not None:
+        try:
+            os.sched_setaffinity(0, {ingest_cpu})
+        except (AttributeError, OSError) as exc:
+            logging.warning("Could not pin ingest loop to CPU %s: %s", ingest_cpu, exc)
+    if rt_priority is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(rt_priority))
+        except (AttributeError, OSError) as exc:
+            logging.warning("Could not apply SCHED_FIFO priority %s: %s", rt_priority, exc)
+
+
+async def _run_async(args: argparse.Namespace) -> int:
+    _tune_ingest_thread(args.ingest_cpu, args.rt_priority)
 
     nats_servers: Sequence[str] = (
         args.nats_servers if args.nats_servers is not None else ["nats://127.0.0.1:4222"]
@@ -79,7 +154,11 @@ async def _run_async(args: argparse.Namespace) -> int:
     await nc.connect(servers=list(nats_servers))
     js = nc.jetstream()
 
-    publisher = AsyncJetStreamPublisher(js, publish_timeout=args.publish_timeout)
+    publisher = AsyncJetStreamPublisher(
+        js,
+        publish_timeout=args.publish_timeout,
+        max_inflight=args.max_inflight,
+    )
     allowed_sensors: Iterable[int] | None = (
         set(args.sensor_ids) if args.sensor_ids is not None else None
     )
@@ -92,13 +171,11 @@ async def _run_async(args: argparse.Namespace) -> int:
     loop = asyncio.get_running_loop()
     stop_event = asyncio.Event()
 
-    for sig in (getattr(signal, "SIGINT", None), getattr(signal, "SIGTERM", None)):
-        if sig is None:
-            continue
+    for sig in _STOP_SIGNALS:
         try:
             loop.add_signal_handler(sig, stop_event.set)
         except NotImplementedError:  # pragma: no cover - Windows fallback
-            pass
+            break
 
     transport, protocol = await loop.create_datagram_endpoint(
         lambda: UDPIngestProtocol(producer, loop=loop),
@@ -119,10 +196,15 @@ async def _run_async(args: argparse.Namespace) -> int:
 def main(argv: Sequence[str] | None = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
+    listener = _configure_logging(args.log_level)
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
     try:
-        return asyncio.run(_run_async(args))
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(_run_async(args))
     except KeyboardInterrupt:  # pragma: no cover - handled via signal but for safety
         return 130
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
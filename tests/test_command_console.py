@@ -1,12 +1,28 @@
-from datetime import UTC, datetime, timedelta
+import asyncio
+import time
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta, timezone
+from types import SimpleNamespace
 
+import cbor2
 import pytest
 
+import command_console_flet
+from command_console_flet import (
+    CommandConsoleApp,
+    CommandController,
+    StatusBroker,
+    StatusPoller,
+    _format_timestamp,
+    main,
+)
+from tspi_kit.commands import CommandSender, OpsControlSender
 from tspi_kit.ui.command_console import (
     ClientPresenceTracker,
     DataChunk,
     DataChunkTag,
     compose_replay_identifier,
+    decode_status_payload,
 )
 
 
@@ -111,6 +127,8 @@ def test_datachunk_offsets_and_identifier_selection() -> None:
     assert chunk.duration_seconds == 1800
     assert chunk.offset_for_timestamp(start + timedelta(minutes=10)) == 600
     assert chunk.timestamp_at_offset(600) == start + timedelta(minutes=10)
+    assert chunk.timestamp_at_offset(-5) == start
+    assert chunk.timestamp_at_offset(10_000) == end
 
     identifier, display = compose_replay_identifier(chunk, start_time=start + timedelta(minutes=12))
     assert "chunk-01" in identifier
@@ -126,3 +144,439 @@ def test_datachunk_rejects_empty_identifier() -> None:
     start = datetime(2025, 1, 1, 0, 0, tzinfo=UTC)
     with pytest.raises(ValueError):
         DataChunk("", start, start + timedelta(hours=1))
+
+
+class _ScriptedConsumer:
+    """Consumer stub returning a fixed number of messages per pull."""
+
+    def __init__(self, counts: list[int]) -> None:
+        self.counts = counts
+        self.requested: list[int] = []
+
+    def pull(self, batch: int):
+        self.requested.append(batch)
+        count = self.counts.pop(0) if self.counts else 0
+        return [SimpleNamespace(data=b"x")] * count
+
+
+class _Publisher:
+    """Publisher stub recording the subjects of every publish call."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def publish(self, subject, data, headers=None, timestamp=None):
+        self.batches.append([subject])
+        return True
+
+    def publish_many(self, messages, timestamp=None):
+        self.batches.append([subject for subject, _data, _headers in messages])
+        return [True] * len(messages)
+
+
+class _Control(SimpleNamespace):
+    """Stand-in for any flet control: keeps its arguments as attributes."""
+
+    def __init__(self, value=None, **kwargs) -> None:
+        super().__init__(value=value, **kwargs)
+
+
+class _ListView(_Control):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(controls=[], **kwargs)
+
+
+class _Page:
+    def __init__(self) -> None:
+        self.title = ""
+        self.controls: list = []
+        self.updates: list[int] = []
+
+    def add(self, *controls) -> None:
+        self.controls.extend(controls)
+
+    def update(self, *controls) -> None:
+        self.updates.append(len(controls))
+
+    def run_task(self, coro_fn):
+        return asyncio.ensure_future(coro_fn())
+
+
+def _fake_flet() -> SimpleNamespace:
+    controls = {
+        name: _Control
+        for name in (
+            "Column",
+            "Container",
+            "DataCell",
+            "DataColumn",
+            "DataRow",
+            "DataTable",
+            "Dropdown",
+            "ElevatedButton",
+            "OutlinedButton",
+            "Row",
+            "Text",
+            "TextField",
+        )
+    }
+    return SimpleNamespace(
+        ListView=_ListView,
+        TextThemeStyle=SimpleNamespace(TITLE_MEDIUM="titleMedium"),
+        colors=SimpleNamespace(ON_SURFACE="onSurface", RED="red"),
+        dropdown=SimpleNamespace(Option=_Control),
+        **controls,
+    )
+
+
+@pytest.fixture
+def make_controller():
+    """Build a CommandController whose senders share one publisher stub."""
+
+    def _make(publisher: _Publisher | None = None) -> CommandController:
+        publisher = publisher or _Publisher()
+        return CommandController(CommandSender(publisher), OpsControlSender(publisher))
+
+    return _make
+
+
+@pytest.fixture
+def make_console(monkeypatch, make_controller):
+    """Build CommandConsoleApp through ``__init__`` against a fake ``flet``."""
+
+    monkeypatch.setattr(command_console_flet, "_ensure_flet", _fake_flet)
+
+    def _make(**kwargs) -> CommandConsoleApp:
+        return CommandConsoleApp(_Page(), make_controller(), **kwargs)
+
+    return _make
+
+
+def _records(payloads: list[bytes]) -> list:
+    return [(payload, decode_status_payload(payload)) for payload in payloads]
+
+
+def test_status_poller_delivers_each_pull_as_one_batch() -> None:
+    batches: list[list] = []
+
+    def _on_batch(payloads: list[bytes]) -> None:
+        batches.append(payloads)
+        poller.stop()
+
+    poller = StatusPoller(_ScriptedConsumer([3]), on_batch=_on_batch, on_error=lambda _msg: None)
+    asyncio.run(asyncio.wait_for(poller.run(), timeout=2.0))
+
+    assert batches == [[(b"x", None)] * 3]
+
+
+def test_status_poller_requests_next_pull_before_delivering_batch() -> None:
+    consumer = _ScriptedConsumer([2, 2])
+    overlapped: list[bool] = []
+
+    def _on_batch(_records: list) -> None:
+        deadline = time.monotonic() + 1.0
+        while len(consumer.requested) < len(overlapped) + 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        overlapped.append(len(consumer.requested) >= len(overlapped) + 2)
+        if len(overlapped) == 2:
+            poller.stop()
+
+    poller = StatusPoller(consumer, batch=4, on_batch=_on_batch, on_error=lambda _msg: None)
+    asyncio.run(asyncio.wait_for(poller.run(), timeout=2.0))
+
+    assert overlapped == [True, True]
+
+
+def test_status_poller_delivers_prefetched_pull_after_stop() -> None:
+    consumer = _ScriptedConsumer([2, 2, 2])
+    batches: list[list] = []
+
+    def _on_batch(records: list) -> None:
+        batches.append(records)
+        poller.stop()
+
+    poller = StatusPoller(consumer, batch=2, on_batch=_on_batch, on_error=lambda _msg: None)
+    asyncio.run(asyncio.wait_for(poller.run(), timeout=2.0))
+
+    assert consumer.requested == [2, 4]
+    assert len(batches) == 2
+
+
+def test_status_poller_adapts_batch_size_and_interval() -> None:
+    consumer = _ScriptedConsumer([4, 8, 3, 0, 0])
+    poller = StatusPoller(
+        consumer,
+        poll_interval=0.05,
+        batch=4,
+        min_batch=2,
+        max_batch=8,
+        max_interval=0.1,
+        on_batch=lambda _payloads: None,
+        on_error=lambda _msg: None,
+    )
+
+    async def _exercise() -> None:
+        task = asyncio.create_task(poller.run())
+        while len(consumer.requested) < 6:
+            await asyncio.sleep(0.01)
+        poller.stop()
+        await asyncio.wait_for(task, timeout=2.0)
+
+    asyncio.run(_exercise())
+
+    assert consumer.requested[:6] == [4, 8, 8, 8, 4, 2]
+
+
+def test_status_poller_poke_interrupts_idle_wait() -> None:
+    consumer = _ScriptedConsumer([0, 1])
+    delivered: list[float] = []
+    poller = StatusPoller(
+        consumer,
+        poll_interval=5.0,
+        on_batch=lambda _payloads: delivered.append(time.monotonic()),
+        on_error=lambda _msg: None,
+    )
+
+    async def _exercise() -> float:
+        task = asyncio.create_task(poller.run())
+        while not consumer.requested:
+            await asyncio.sleep(0.01)
+        started = time.monotonic()
+        poller.poke()
+        while not delivered:
+            await asyncio.sleep(0.01)
+        poller.stop()
+        await asyncio.wait_for(task, timeout=2.0)
+        return started
+
+    started = asyncio.run(_exercise())
+
+    assert delivered[0] - started < 2.0
+
+
+def test_refresh_clients_reuses_rows_and_skips_unchanged_updates(make_console) -> None:
+    tracker = ClientPresenceTracker()
+    bravo, _ = tracker.process_payload({"client_id": "bravo", "state": "FOLLOWING_LIVESTREAM", "ts": "2025-01-01T00:00:00Z"})
+    alpha, _ = tracker.process_payload({"client_id": "alpha", "state": "FOLLOWING_LIVESTREAM", "ts": "2025-01-01T00:00:00Z"})
+    app = make_console()
+    app._clients.update(alpha=alpha, bravo=bravo)
+    updates = app.page.updates
+
+    app._refresh_clients()
+    rows = list(app.client_table.rows)
+    assert [row.cells[0].value.value for row in rows] == ["alpha", "bravo"]
+    assert updates == [1]
+
+    app._refresh_clients()
+    assert updates == [1]
+
+    app._clients["alpha"] = replace(alpha, operator="ops")
+    app._refresh_clients()
+    assert app.client_table.rows[0] is rows[0]
+    assert rows[0].cells[5].value.value == "ops"
+    assert updates == [1, 1]
+
+    app._clients["alpha"] = replace(
+        app._clients["alpha"], last_seen_ts=alpha.last_seen_ts + timedelta(milliseconds=200)
+    )
+    app._refresh_clients()
+    assert updates == [1, 1]
+
+
+def test_console_log_keeps_newest_entries_only(make_console) -> None:
+    app = make_console()
+    app._ft.Text = lambda value, color=None: value
+
+    for index in range(command_console_flet._LOG_LIMIT + 3):
+        app._append_log(f"entry {index}", update=False)
+
+    controls = app.log_view.controls
+    assert len(controls) == command_console_flet._LOG_LIMIT
+    assert controls[0].endswith("entry 3")
+    assert controls[-1].endswith(f"entry {command_console_flet._LOG_LIMIT + 2}")
+
+
+def test_console_coalesces_page_updates_within_a_tick(make_console) -> None:
+    app = make_console()
+    updates = app.page.updates
+
+    async def _exercise() -> None:
+        for _ in range(5):
+            app._schedule_update()
+        assert updates == []
+        await asyncio.sleep(0)
+        assert updates == [0]
+        app._schedule_update(app.client_table, app.log_view)
+        app._schedule_update(app.log_view)
+        await asyncio.sleep(0)
+
+    asyncio.run(_exercise())
+    assert updates == [0, 2]
+
+
+def test_status_batch_keeps_clients_sorted_by_id(make_console) -> None:
+    app = make_console()
+    payloads = [
+        cbor2.dumps({"client_id": client_id, "state": "FOLLOWING_LIVESTREAM", "ts": "2025-01-01T00:00:00Z"})
+        for client_id in ("charlie", "alpha", "bravo")
+    ]
+
+    app._handle_status_batch(_records(payloads[:1]))
+    app._handle_status_batch(_records(payloads[1:]))
+
+    assert list(app._clients) == ["alpha", "bravo", "charlie"]
+    assert [row.cells[0].value.value for row in app.client_table.rows] == ["alpha", "bravo", "charlie"]
+
+
+def test_command_controller_flushes_deferred_commands_together(make_controller) -> None:
+    publisher = _Publisher()
+    controller = make_controller(publisher)
+    statuses: list[str] = []
+    errors: list[str] = []
+    controller.status_changed.connect(statuses.append)
+    controller.error_occurred.connect(errors.append)
+
+    controller.set_units("imperial", defer=True)
+    controller.set_units("kelvin", defer=True)
+    controller.set_marker_color("#00ff00", defer=True)
+    assert publisher.batches == []
+
+    controller.flush()
+    assert len(publisher.batches) == 1
+    assert statuses == ["Units set to imperial", "Marker color set to #00ff00"]
+    assert errors and "Units must be" in errors[0]
+
+    controller.set_units("metric")
+    assert len(publisher.batches) == 2
+
+    replays: list[str] = []
+    controller.group_replay_changed.connect(replays.append)
+    controller.start_group_replay("2025-09-28T11:00:00Z", stream="TSPI", defer=True)
+    controller.stop_group_replay(None, defer=True)
+    assert replays == []
+
+    controller.flush()
+    assert publisher.batches[-1] == ["tspi.ops.ctrl", "tspi.ops.ctrl"]
+    assert len(replays) == 2 and replays[0] and replays[1] == ""
+
+
+def test_command_controller_moves_replay_channel_only_after_send(make_controller) -> None:
+    class _FlakyPublisher(_Publisher):
+        failure: str | None = None
+
+        def publish_many(self, messages, timestamp=None):
+            if self.failure == "raise":
+                raise ConnectionError("server unavailable")
+            if self.failure == "reject":
+                return [False] * len(messages)
+            return super().publish_many(messages, timestamp=timestamp)
+
+    publisher = _FlakyPublisher()
+    controller = make_controller(publisher)
+    ops = controller._ops_sender
+    errors: list[str] = []
+    controller.error_occurred.connect(errors.append)
+
+    publisher.failure = "reject"
+    controller.start_group_replay("2025-09-28T11:00:00Z", stream="TSPI")
+    assert ops.active_channel_id is None
+
+    publisher.failure = None
+    controller.start_group_replay("2025-09-28T11:00:00Z", stream="TSPI")
+    assert ops.active_channel_id == "replay.20250928T110000Z"
+
+    publisher.failure = "raise"
+    controller.stop_group_replay(None)
+    assert ops.active_channel_id == "replay.20250928T110000Z"
+    publisher.failure = "reject"
+    controller.start_group_replay("2025-09-28T12:00:00Z", stream="TSPI")
+    assert ops.active_channel_id == "replay.20250928T110000Z"
+    assert len(errors) == 3
+
+
+def test_status_broker_fans_out_one_poller_to_all_subscribers() -> None:
+    consumer = _ScriptedConsumer([2])
+    broker = StatusBroker(consumer, poll_interval=0.05)
+    first: list[list] = []
+    second: list[list] = []
+    errors: list[str] = []
+
+    async def _exercise() -> None:
+        tasks: list[asyncio.Task] = []
+
+        def _run_task(coro_fn):
+            tasks.append(asyncio.create_task(coro_fn()))
+            return tasks[-1]
+
+        broker.subscribe(first.append, errors.append, run_task=_run_task)
+        broker.subscribe(second.append, errors.append, run_task=_run_task)
+        assert len(tasks) == 1
+        while not first:
+            await asyncio.sleep(0.01)
+        broker.unsubscribe(first.append, errors.append)
+        assert not tasks[0].done()
+        broker.unsubscribe(second.append, errors.append)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert tasks[0].done()
+
+    asyncio.run(_exercise())
+
+    assert first == second == [[(b"x", None), (b"x", None)]]
+    assert errors == []
+
+
+def test_status_batch_skips_repeated_timestamped_payloads(make_console) -> None:
+    app = make_console()
+    calls: list[dict] = []
+    process_payload = app._tracker.process_payload
+
+    def _tracking(payload):
+        calls.append(payload)
+        return process_payload(payload)
+
+    app._tracker.process_payload = _tracking
+    first = cbor2.dumps({"client_id": "alpha", "state": "FOLLOWING_LIVESTREAM", "ts": "2025-01-01T00:00:00Z"})
+    second = cbor2.dumps({"client_id": "alpha", "state": "FOLLOWING_LIVESTREAM", "ts": "2025-01-01T00:00:05Z"})
+    untimed = cbor2.dumps({"client_id": "bravo", "state": "FOLLOWING_LIVESTREAM"})
+
+    app._handle_status_batch(_records([first, first, untimed, untimed]))
+    app._handle_status_batch(_records([second, first]))
+
+    assert len(calls) == 5
+    assert app._latest_status == {first: "alpha"}
+
+
+def test_console_shutdown_disconnects_replay_poke(make_console) -> None:
+    broker = StatusBroker(_ScriptedConsumer([]))
+    pokes: list[None] = []
+    broker.poke = lambda: pokes.append(None)
+
+    async def _exercise() -> CommandConsoleApp:
+        app = make_console(status_broker=broker)
+        app.controller.group_replay_changed.emit("replay.one")
+        app.shutdown()
+        app.controller.group_replay_changed.emit("")
+        return app
+
+    app = asyncio.run(_exercise())
+
+    assert pokes == [None]
+    assert app._poke_status_broker not in tuple(app.controller.group_replay_changed.subscribers())
+
+
+def test_headless_console_runs_in_memory() -> None:
+    assert main(["--headless", "--units", "metric", "--group-replay-id", "2025-09-28T11:00:00Z", "--stop-group-replay"]) == 0
+
+
+def test_headless_console_reports_rejected_commands() -> None:
+    with pytest.raises(SystemExit, match="channel_id is required"):
+        main(["--headless", "--units", "metric", "--stop-group-replay"])
+
+
+def test_console_timestamp_formatting_matches_datetime_strftime() -> None:
+    values = [
+        datetime(2025, 1, 1, 3, 0, 59, 999999, tzinfo=timezone(timedelta(hours=2))),
+        datetime(2024, 2, 29, 23, 59, 59, tzinfo=UTC),
+    ]
+    for value in values:
+        assert _format_timestamp(value) == value.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%SZ")
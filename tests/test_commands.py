@@ -90,3 +90,99 @@ def test_ops_sender_requires_channel_id_when_unknown() -> None:
         assert "channel_id" in str(exc)
     else:  # pragma: no cover - defensive
         raise AssertionError("Expected ValueError when stopping without a known channel")
+
+
+def test_send_batch_uses_publish_many_when_available() -> None:
+    class _BatchPublisher(_StubPublisher):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches = []
+
+        def publish_many(self, messages, timestamp=None):
+            self.batches.append(list(messages))
+            return [True] * len(messages)
+
+    publisher = _BatchPublisher()
+    sender = CommandSender(publisher)
+
+    payloads = sender.send_batch([sender.units_command("Imperial"), sender.marker_color_command(" #123456 ")])
+
+    assert not publisher.messages
+    assert len(publisher.batches) == 1
+    subjects = [subject for subject, _data, _headers in publisher.batches[0]]
+    assert subjects == [f"{COMMAND_SUBJECT_PREFIX}.units", f"{COMMAND_SUBJECT_PREFIX}.marker_color"]
+    assert [payload.payload for payload in payloads] == [{"units": "imperial"}, {"marker_color": "#123456"}]
+    assert publisher.batches[0][0][2] == {"Nats-Msg-Id": payloads[0].cmd_id}
+
+
+def test_send_batch_falls_back_to_individual_publishes() -> None:
+    publisher = _StubPublisher()
+    sender = CommandSender(publisher)
+
+    sender.send_batch([sender.units_command("metric"), sender.session_metadata_command("Falcon", "7")])
+
+    assert [subject for subject, _data, _headers in publisher.messages] == [
+        f"{COMMAND_SUBJECT_PREFIX}.units",
+        f"{COMMAND_SUBJECT_PREFIX}.session_metadata",
+    ]
+
+
+def test_send_batch_includes_ops_control_commands() -> None:
+    class _BatchPublisher(_StubPublisher):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches = []
+
+        def publish_many(self, messages, timestamp=None):
+            self.batches.append(list(messages))
+            return [True] * len(messages)
+
+    publisher = _BatchPublisher()
+    sender = CommandSender(publisher, sender_id="console")
+    ops = OpsControlSender(publisher, sender_id="console")
+
+    start_subject, start = ops.start_group_replay_command("2025-09-28T11:00:00Z")
+    stop_subject, stop = ops.stop_group_replay_command(start.message.channel.channel_id)
+    sender.send_batch([sender.units_command("metric"), (start_subject, start), (stop_subject, stop)])
+    ops.commit(start)
+    ops.commit(stop)
+
+    assert not publisher.messages
+    assert [subject for subject, _data, _headers in publisher.batches[0]] == [
+        f"{COMMAND_SUBJECT_PREFIX}.units",
+        OPS_CONTROL_SUBJECT,
+        OPS_CONTROL_SUBJECT,
+    ]
+    assert stop.message.channel_id == start.message.channel.channel_id
+    _subject, data, headers = publisher.batches[0][2]
+    assert cbor2.loads(data)["type"] == "GroupReplayStop"
+    assert headers == {"X-Command-Sender": "console", "Nats-Msg-Id": stop.message_id}
+    assert ops.active_channel_id is None
+
+
+def test_ops_sender_keeps_active_channel_when_publish_fails() -> None:
+    class _FailingPublisher(_StubPublisher):
+        def publish(self, subject, data, headers=None, timestamp=None):
+            return False
+
+    ops = OpsControlSender(_FailingPublisher())
+
+    try:
+        ops.start_group_replay("2025-09-28T11:00:00Z")
+    except RuntimeError:
+        pass
+    else:  # pragma: no cover - defensive
+        raise AssertionError("Expected RuntimeError for a failed publish")
+    assert ops.active_channel_id is None
+
+
+def test_ops_sender_builders_leave_active_channel_alone() -> None:
+    publisher = _StubPublisher()
+    ops = OpsControlSender(publisher)
+    started = ops.start_group_replay("2025-09-28T11:00:00Z")
+
+    ops.start_group_replay_command("2025-09-28T12:00:00Z")
+    ops.stop_group_replay_command()
+
+    assert ops.active_channel_id == started.channel.channel_id
+    assert len(publisher.messages) == 1
@@ -4,7 +4,7 @@ import struct
 
 import pytest
 
-from tspi_kit.datagrams import ParsedTSPI, parse_tspi_datagram
+from tspi_kit.datagrams import ParsedTSPI, parse_tspi_datagram, peek_sensor_id
 from tspi_kit.jetstream import build_subject, message_headers
 from tspi_kit.schema import validate_payload
 
@@ -193,3 +193,19 @@ def test_invalid_version() -> None:
 
     with pytest.raises(ValueError):
         parse_tspi_datagram(datagram)
+
+
+def test_peek_sensor_id_reads_header_only() -> None:
+    header = _build_header(
+        message_type=0xC1,
+        sensor_id=4321,
+        day=1,
+        time_ticks=0,
+        status=0,
+        status_flags=0,
+    )
+    datagram = _combine(header, struct.pack(">iii hhh hhh".replace(" ", ""), *([0] * 9)))
+
+    assert peek_sensor_id(datagram) == parse_tspi_datagram(datagram).sensor_id == 4321
+    with pytest.raises(ValueError):
+        peek_sensor_id(datagram[:-1])
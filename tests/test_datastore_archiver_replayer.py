@@ -377,6 +377,31 @@ def test_archiver_persists_messages_commands_and_tags() -> None:
     asyncio.run(_exercise())
 
 
+def test_archiver_overlaps_subject_fetches() -> None:
+    class _SlowSubscription:
+        active = 0
+        peak = 0
+
+        async def fetch(self, batch: int, *, timeout: float | None = None) -> List[_FakeMsg]:  # noqa: ARG002
+            cls = type(self)
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+            await asyncio.sleep(0.01)
+            cls.active -= 1
+            raise asyncio.TimeoutError
+
+    class _SlowJetStream:
+        async def pull_subscribe(self, subject: str, *, durable: str | None = None) -> _SlowSubscription:  # noqa: ARG002
+            return _SlowSubscription()
+
+    async def _exercise() -> int:
+        archiver = Archiver(_SlowJetStream(), _FakeTimescaleDatastore())
+        return await archiver.drain()
+
+    assert asyncio.run(_exercise()) == 0
+    assert _SlowSubscription.peak == 3
+
+
 def test_store_replayer_replays_with_pacing() -> None:
     async def _exercise() -> None:
         jetstream = _FakeJetStream()
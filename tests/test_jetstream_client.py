@@ -1,4 +1,17 @@
-from tspi_kit.jetstream_client import normalize_stream_subjects
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from nats.js.api import AckPolicy
+from nats.js.errors import NotFoundError
+
+from tspi_kit.jetstream_client import (
+    JetStreamConsumerAdapter,
+    JetStreamThreadedClient,
+    normalize_stream_subjects,
+)
 
 
 def test_normalize_stream_subjects_removes_overlaps():
@@ -32,3 +45,161 @@ def test_normalize_stream_subjects_handles_wildcard_ordering():
         "tspi.>",
     ]
     assert normalize_stream_subjects(subjects) == ["tspi.>"]
+
+
+class _FakeMsg:
+    def __init__(self, data: bytes, acks: list) -> None:
+        self.data = data
+        self._acks = acks
+
+    async def ack(self) -> None:
+        self._acks.append(self.data)
+
+
+class _FakeSubscription:
+    def __init__(self, messages) -> None:
+        self._messages = messages
+
+    async def fetch(self, batch, timeout=None):
+        return self._messages[:batch]
+
+
+@pytest.fixture
+def loop_thread():
+    """Yield an event loop running on a background thread, as the client uses."""
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=1)
+    loop.close()
+
+
+@pytest.fixture
+def threaded_client():
+    """Yield a client whose loop thread runs without connecting to NATS."""
+
+    client = JetStreamThreadedClient(["nats://127.0.0.1:4222"])
+    client._thread.start()
+    yield client
+    client._loop.call_soon_threadsafe(client._loop.stop)
+    client._thread.join(timeout=1)
+    client._loop.close()
+
+
+def _pull(loop, *, ack: bool):
+    acks: list = []
+    messages = [_FakeMsg(b"a", acks), _FakeMsg(b"b", acks)]
+    adapter = JetStreamConsumerAdapter(loop, _FakeSubscription(messages), ack=ack)
+    return [message.data for message in adapter.pull(10)], acks
+
+
+def test_consumer_adapter_acks_each_batch(loop_thread):
+    data, acks = _pull(loop_thread, ack=True)
+    assert data == [b"a", b"b"]
+    assert sorted(acks) == [b"a", b"b"]
+
+
+def test_consumer_adapter_skips_acks_for_ack_none_consumers(loop_thread):
+    data, acks = _pull(loop_thread, ack=False)
+    assert data == [b"a", b"b"]
+    assert acks == []
+
+
+def test_consumer_adapter_leaves_timed_out_pulls_unacked(loop_thread):
+    class _SlowSubscription(_FakeSubscription):
+        async def fetch(self, batch, timeout=None):
+            await asyncio.sleep(0.2)
+            return self._messages[:batch]
+
+    acks: list = []
+    adapter = JetStreamConsumerAdapter(loop_thread, _SlowSubscription([_FakeMsg(b"a", acks)]))
+    pulled = adapter.finish_pull(adapter.start_pull(10), timeout=0.01)
+    time.sleep(0.3)
+
+    assert pulled == []
+    assert acks == []
+
+
+def test_threaded_client_creates_pull_consumers_concurrently(threaded_client):
+    class _FakeJetStream:
+        def __init__(self) -> None:
+            self.active = 0
+            self.peak = 0
+
+        async def pull_subscribe(self, subject, *, durable=None, stream=None, config=None):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return _FakeSubscription([subject, durable, stream])
+
+    threaded_client._js = fake = _FakeJetStream()
+    adapters = threaded_client.create_pull_consumers(
+        [("tspi.>", "live-0", "TSPI"), ("tags.broadcast", "live-1", "TSPI"), ("player.>", "replay-0", None)]
+    )
+
+    assert [adapter._subscription._messages[0] for adapter in adapters] == [
+        "tspi.>",
+        "tags.broadcast",
+        "player.>",
+    ]
+    assert fake.peak == 3
+
+
+def test_threaded_client_backs_off_while_stream_propagates(threaded_client):
+    class _LateJetStream:
+        def __init__(self) -> None:
+            self.attempts = 0
+
+        async def pull_subscribe(self, subject, *, durable=None, stream=None, config=None):
+            self.attempts += 1
+            if self.attempts <= 3:
+                raise NotFoundError()
+            return _FakeSubscription([subject])
+
+    threaded_client._js = fake = _LateJetStream()
+    started = time.monotonic()
+    adapter = threaded_client.create_pull_consumer("tspi.>", durable="live-0", stream="TSPI")
+
+    assert fake.attempts == 4
+    assert adapter._subscription._messages == ["tspi.>"]
+    # Retries start at 25 ms and double, instead of a fixed half-second poll.
+    assert time.monotonic() - started < 0.5
+
+
+def test_threaded_client_acks_by_each_consumers_actual_policy(threaded_client):
+    existing = {"status-0": AckPolicy.EXPLICIT}
+
+    class _PolicySubscription(_FakeSubscription):
+        def __init__(self, policy) -> None:
+            super().__init__([])
+            self._policy = policy
+
+        async def consumer_info(self):
+            return SimpleNamespace(config=SimpleNamespace(ack_policy=self._policy))
+
+    class _FakeJetStream:
+        def __init__(self) -> None:
+            self.configs: list = []
+
+        async def pull_subscribe(self, subject, *, durable=None, stream=None, config=None):
+            self.configs.append(config)
+            if durable in existing:
+                return _PolicySubscription(existing[durable])
+            # nats-py fills in the consumer's identity on the config it gets.
+            config.durable_name = durable
+            config.filter_subject = subject
+            return _PolicySubscription(config.ack_policy.value)
+
+    threaded_client._js = fake = _FakeJetStream()
+    adapters = threaded_client.create_pull_consumers(
+        [("status.a", "status-0", "TSPI"), ("status.b", "status-1", "TSPI"), ("status.c", "status-2", "TSPI")],
+        ack_policy="none",
+    )
+
+    assert len({id(config) for config in fake.configs}) == 3
+    assert [config.filter_subject for config in fake.configs] == [None, "status.b", "status.c"]
+    assert [adapter._ack for adapter in adapters] == [True, False, False]
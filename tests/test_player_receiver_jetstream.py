@@ -127,3 +127,36 @@ def test_player_state_switches_sources_and_scrubs() -> None:
     assert any(
         message.subject == "player.training.playout.geocentric.701" for message in stream._messages
     )
+
+
+def test_composite_receiver_starts_every_pull_before_waiting() -> None:
+    from concurrent.futures import Future
+    from types import SimpleNamespace
+
+    import cbor2
+
+    from tspi_kit.receiver import CompositeTSPIReceiver
+
+    started: list[str] = []
+
+    class _DeferredConsumer:
+        def __init__(self, name: str, epoch_ms: int) -> None:
+            self.name = name
+            self.epoch_ms = epoch_ms
+
+        def start_pull(self, batch: int) -> Future:
+            started.append(self.name)
+            future: Future = Future()
+            future.set_result([SimpleNamespace(data=cbor2.dumps({"name": self.name, "recv_epoch_ms": self.epoch_ms}))])
+            return future
+
+        def finish_pull(self, pull: Future) -> list:
+            # Every pull must already be in flight before any is awaited.
+            assert started == ["late", "early"]
+            return pull.result()
+
+    receiver = CompositeTSPIReceiver(
+        [TSPIReceiver(_DeferredConsumer("late", 2_000)), TSPIReceiver(_DeferredConsumer("early", 1_000))]
+    )
+
+    assert [message["name"] for message in receiver.fetch(1)] == ["early", "late"]
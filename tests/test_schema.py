@@ -79,3 +79,28 @@ def test_missing_field_raises_validation_error() -> None:
 
     with pytest.raises(ValidationError):
         validate_payload(payload)
+
+
+def test_fast_validator_defers_edge_cases_to_jsonschema() -> None:
+    from tspi_kit.schema import _compile_fast_validator
+
+    is_valid = _compile_fast_validator(load_schema())
+    assert is_valid(_base_payload())
+
+    integral_float = _base_payload()
+    integral_float["day"] = 12.0
+    assert not is_valid(integral_float)
+    validate_payload(integral_float)
+
+    for key, value in (("sensor_id", True), ("status", 256), ("type", "polar")):
+        payload = _base_payload()
+        payload[key] = value
+        assert not is_valid(payload)
+        with pytest.raises(ValidationError):
+            validate_payload(payload)
+
+    extra_key = _base_payload()
+    extra_key["payload"]["range_m"] = 1.0
+    assert not is_valid(extra_key)
+    with pytest.raises(ValidationError):
+        validate_payload(extra_key)
@@ -0,0 +1,47 @@
+"""Tests for the lightweight UI signal helper."""
+from __future__ import annotations
+
+from tspi_kit.ui.signals import Signal
+
+
+def test_signal_ignores_duplicate_connections() -> None:
+    signal: Signal[int] = Signal()
+    received: list[int] = []
+    signal.connect(received.append)
+    signal.connect(received.append)
+
+    signal.emit(7)
+
+    assert received == [7]
+    assert len(tuple(signal.subscribers())) == 1
+
+
+def test_signal_emit_uses_snapshot_of_subscribers() -> None:
+    signal: Signal[None] = Signal()
+    calls: list[str] = []
+
+    def late() -> None:
+        calls.append("late")
+
+    def first() -> None:
+        calls.append("first")
+        signal.connect(late)
+
+    signal.connect(first)
+    signal.emit()
+    assert calls == ["first"]
+
+    signal.emit()
+    assert calls == ["first", "first", "late"]
+
+
+def test_signal_disconnect_removes_callback() -> None:
+    signal: Signal[int] = Signal()
+    received: list[int] = []
+    signal.connect(received.append)
+    signal.disconnect(received.append)
+    signal.disconnect(received.append)
+
+    signal.emit(1)
+
+    assert received == []
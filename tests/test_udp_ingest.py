@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Any
 
+import pytest
+
 from tspi_kit import InMemoryJetStream
-from tspi_kit.producer import TSPIProducer
+from tspi_kit.producer import IngestBatchError, TSPIProducer
 from tspi_kit.udp_ingest import AsyncJetStreamPublisher, UDPIngestProtocol
 
 
@@ -101,6 +104,116 @@ def test_udp_protocol_dispatches_to_producer() -> None:
     asyncio.run(_exercise())
 
 
+def test_udp_protocol_batches_datagrams_received_in_one_tick() -> None:
+    class Recorder:
+        def __init__(self) -> None:
+            self.subjects: list[str] = []
+
+        async def publish(self, subject: str, payload: bytes, *, headers=None, timestamp=None) -> None:
+            await asyncio.sleep(0)
+            self.subjects.append(subject)
+
+    publisher = Recorder()
+    producer = TSPIProducer(publisher)
+
+    async def _exercise() -> int:
+        protocol = UDPIngestProtocol(producer)
+        protocol.datagram_received(_geocentric_datagram(sensor_id=1), ("127.0.0.1", 1))
+        protocol.datagram_received(b"short", ("127.0.0.1", 1))
+        protocol.datagram_received(_geocentric_datagram(sensor_id=2), ("127.0.0.1", 1))
+        tasks = len(protocol._pending)
+        await protocol.drain()
+        return tasks
+
+    assert asyncio.run(_exercise()) == 1
+    assert sorted(publisher.subjects) == ["tspi.geocentric.1", "tspi.geocentric.2"]
+
+
+class _FlakyPublisher:
+    """Publisher that fails every publish for sensor 2."""
+
+    def __init__(self) -> None:
+        self.subjects: list[str] = []
+
+    async def publish(self, subject: str, payload: bytes, *, headers=None, timestamp=None) -> None:
+        await asyncio.sleep(0)
+        if subject.endswith(".2"):
+            raise ConnectionError(f"no ack for {subject}")
+        self.subjects.append(subject)
+
+
+def _mixed_batch() -> list[tuple[bytes, float]]:
+    return [
+        (_geocentric_datagram(sensor_id=1), 1_700_000_000.0),
+        (b"short", 1_700_000_000.1),
+        (_geocentric_datagram(sensor_id=2), 1_700_000_000.2),
+        (_geocentric_datagram(sensor_id=3), 1_700_000_000.3),
+    ]
+
+
+def test_ingest_many_reports_every_failure_after_publishing_the_rest() -> None:
+    publisher = _FlakyPublisher()
+    producer = TSPIProducer(publisher)
+
+    with pytest.raises(IngestBatchError) as excinfo:
+        asyncio.run(producer.ingest_many_async(_mixed_batch()))
+
+    error = excinfo.value
+    assert publisher.subjects == ["tspi.geocentric.1", "tspi.geocentric.3"]
+    assert [index for index, _ in error.rejected] == [1]
+    assert "exactly 37 bytes" in str(error.rejected[0][1])
+    assert [(index, type(exc)) for index, exc in error.failed] == [(2, ConnectionError)]
+    assert [payload is not None for payload in error.payloads] == [True, False, False, True]
+
+
+def test_ingest_many_keeps_good_datagrams_when_preparation_raises() -> None:
+    publisher = _FlakyPublisher()
+    producer = TSPIProducer(publisher)
+    prepare = producer._prepare_message
+
+    def _prepare(datagram: bytes, recv_time: float):
+        if recv_time == 1_700_000_000.1:
+            raise KeyError("status")
+        return prepare(datagram, recv_time)
+
+    producer._prepare_message = _prepare
+    batch = [
+        (_geocentric_datagram(sensor_id=1), 1_700_000_000.0),
+        (_geocentric_datagram(sensor_id=4), 1_700_000_000.1),
+        (_geocentric_datagram(sensor_id=3), 1_700_000_000.3),
+    ]
+
+    with pytest.raises(IngestBatchError) as excinfo:
+        asyncio.run(producer.ingest_many_async(batch))
+
+    error = excinfo.value
+    assert publisher.subjects == ["tspi.geocentric.1", "tspi.geocentric.3"]
+    assert [(index, type(exc)) for index, exc in error.rejected] == [(1, KeyError)]
+    assert error.failed == []
+    assert [payload is not None for payload in error.payloads] == [True, False, True]
+
+
+def test_udp_protocol_logs_each_failed_datagram(caplog) -> None:
+    producer = TSPIProducer(_FlakyPublisher())
+
+    async def _exercise() -> None:
+        protocol = UDPIngestProtocol(producer)
+        for datagram, _ in _mixed_batch():
+            protocol.datagram_received(datagram, ("127.0.0.1", 1))
+        await protocol.drain()
+
+    with caplog.at_level(logging.WARNING, logger="tspi_kit.udp_ingest"):
+        asyncio.run(_exercise())
+
+    messages = [(record.levelno, record.getMessage()) for record in caplog.records]
+    assert (
+        logging.WARNING,
+        "Dropped malformed TSPI datagram (5 bytes): TSPI datagram must be exactly 37 bytes; received 5",
+    ) in messages
+    assert (logging.ERROR, "Failed to publish TSPI datagram: no ack for tspi.geocentric.2") in messages
+    assert len(messages) == 2
+
+
 def test_async_publisher_passes_timeout() -> None:
     class FakeJetStream:
         def __init__(self) -> None:
@@ -118,3 +231,26 @@ def test_async_publisher_passes_timeout() -> None:
     asyncio.run(_exercise())
 
     assert jetstream.calls == [("tspi.test", b"data", {"X": "1"}, 3.5)]
+
+
+def test_async_publisher_bounds_inflight_publishes() -> None:
+    class SlowJetStream:
+        def __init__(self) -> None:
+            self.active = 0
+            self.peak = 0
+
+        async def publish(self, subject: str, payload: bytes, *, headers=None, timeout=None) -> None:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.001)
+            self.active -= 1
+
+    jetstream = SlowJetStream()
+    publisher = AsyncJetStreamPublisher(jetstream, max_inflight=3)
+
+    async def _exercise() -> None:
+        await asyncio.gather(*(publisher.publish("tspi.test", b"x") for _ in range(10)))
+
+    asyncio.run(_exercise())
+
+    assert jetstream.peak == 3
@@ -307,3 +307,90 @@ def test_forward_jump_replays_commands_and_tags():
 
     assert commands and commands[-1]["cmd_id"] == command_payload.cmd_id
     assert tags and tags[-1]["id"] == tag_payload["id"]
+
+
+def test_list_widget_tracks_items_by_data():
+    from tspi_kit.ui.player import _ListWidget
+
+    widget = _ListWidget()
+    widget.addItem("log entry")
+    widget.add_or_replace("Alpha (a)", "a")
+    widget.add_or_replace("Bravo (b)", "b")
+    widget.add_or_replace("Alpha v2 (a)", "a")
+
+    assert [widget.item(index).text() for index in range(widget.count())] == [
+        "log entry",
+        "Bravo (b)",
+        "Alpha v2 (a)",
+    ]
+
+    widget.remove_by_data("b")
+    widget.remove_by_data("missing")
+    assert widget.count() == 2
+
+    widget.takeItem(1)
+    widget.add_or_replace("Alpha v3 (a)", "a")
+    assert widget.count() == 2
+    assert widget.item(1).text() == "Alpha v3 (a)"
+
+
+def test_spin_and_combo_skip_unchanged_values():
+    from tspi_kit.ui.player import _ComboBox, _SpinBox
+
+    spin = _SpinBox(minimum=0.5, maximum=2.0, value=1.0)
+    values: list[float] = []
+    spin.valueChanged.connect(values.append)
+    spin.setValue(1.0)
+    spin.setValue(5.0)
+    spin.setValue(3.0)
+    assert values == [2.0]
+
+    combo = _ComboBox(["receive", "tspi"], "receive")
+    texts: list[str] = []
+    combo.currentTextChanged.connect(texts.append)
+    combo.setCurrentText("receive")
+    combo.setCurrentText("tspi")
+    combo.setCurrentText("tspi")
+    assert texts == ["tspi"]
+
+
+def test_player_metrics_serialise_to_json():
+    import json
+
+    from tspi_kit.ui.player import PlayerMetrics
+
+    metrics = PlayerMetrics(frames=3, rate=1.5, source="livestream", position=4, timeline=9)
+
+    assert json.loads(metrics.to_json()) == {
+        "frames": 3,
+        "rate": 1.5,
+        "clock": "receive",
+        "lag": 0,
+        "source": "livestream",
+        "position": 4,
+        "timeline": 9,
+    }
+
+
+def test_step_once_reads_clock_after_blocking_preload():
+    import time
+
+    from types import SimpleNamespace
+
+    class _SlowConsumer:
+        def pull(self, batch):
+            time.sleep(0.05)
+            command = {"cmd_id": "cmd-1", "name": "display.units", "payload": {"units": "metric"}}
+            return [SimpleNamespace(data=cbor2.dumps(command))]
+
+    state = PlayerState(
+        {"livestream": TSPIReceiver(_SlowConsumer())}, ui_config=UiConfig(), initial_source="livestream"
+    )
+    state.start()
+    before = time.monotonic()
+
+    now = state.step_once()
+
+    assert now is not None
+    assert now - before >= 0.05
+    assert state.position() == 1
@@ -6,6 +6,7 @@ import argparse
 import json
 import socket
 import threading
+from functools import lru_cache
 from typing import Any
 
 from tspi_kit.commands import COMMAND_SUBJECT_PREFIX
@@ -16,7 +17,8 @@ from tspi_kit.ui.flet_app import _ensure_flet, pick_flet_web_port
 from tspi_kit.ui.player import connect_in_memory
 
 
-def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="TSPI Generator (Flet)")
     parser.add_argument("--headless", action="store_true")
     parser.add_argument("--count", type=int, default=50)
@@ -70,7 +72,12 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         metavar="HOST:PORT",
         help="Send generated datagrams to the given UDP endpoint (repeatable).",
     )
+    return parser
+
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    # The parser is built once per process and reused by every call.
+    parser = _build_parser()
     args = parser.parse_args(argv)
 
     udp_targets: list[tuple[str, int]] = []
@@ -1,6 +1,7 @@
 """Archiver component that drains JetStream into TimescaleDB."""
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from typing import Any, Dict
 
@@ -70,11 +71,37 @@ class Archiver:
         if isinstance(JSNATSTimeoutError, type):
             timeout_exceptions += (JSNATSTimeoutError,)
 
-        for kind, subscription in self._subscriptions.items():
-            try:
-                messages = await subscription.fetch(batch_size, timeout=self._pull_timeout)
-            except timeout_exceptions:
-                continue
+        # Issue every subject's fetch up front so their network waits overlap;
+        # the batches are still persisted one subject at a time, in order.
+        fetches = {
+            kind: asyncio.ensure_future(
+                subscription.fetch(batch_size, timeout=self._pull_timeout)
+            )
+            for kind, subscription in self._subscriptions.items()
+        }
+        try:
+            for kind, fetch in fetches.items():
+                stored += await self._persist_fetch(kind, fetch, timeout_exceptions)
+        finally:
+            # Only reached with pending fetches when persisting failed; their
+            # unacknowledged messages are redelivered on the next drain.
+            for fetch in fetches.values():
+                fetch.cancel()
+        return stored
+
+    async def _persist_fetch(
+        self,
+        kind: str,
+        fetch: asyncio.Future[Any],
+        timeout_exceptions: tuple[type[BaseException], ...],
+    ) -> int:
+        try:
+            messages = await fetch
+        except timeout_exceptions:
+            return 0
+        stored = 0
+        persisted = []
+        try:
             for message in messages:
                 payload = cbor2.loads(message.data)
                 timestamp = self._message_timestamp(message)
@@ -86,7 +113,7 @@ class Archiver:
                     published_ts=timestamp,
                     raw_cbor=message.data,
                 )
-                await message.ack()
+                persisted.append(message)
                 if message_id is None:
                     continue
                 stored += 1
@@ -98,6 +125,12 @@ class Archiver:
                     await self._datastore.apply_tag_event(
                         message.subject, payload, message_id=message_id
                     )
+        finally:
+            # Acknowledge the stored messages together once per fetch rather
+            # than awaiting a round trip per message; anything not yet
+            # persisted is left for redelivery.
+            if persisted:
+                await asyncio.gather(*(message.ack() for message in persisted))
         return stored
 
     @staticmethod
@@ -5,7 +5,7 @@ import time
 import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import cbor2
 
@@ -40,6 +40,24 @@ class CommandPayload:
             "payload": dict(self.payload),
         }
 
+    def headers(self) -> Dict[str, str]:
+        return {"Nats-Msg-Id": self.cmd_id}
+
+
+@dataclass(slots=True)
+class OpsControlCommand:
+    """Prepared operations control broadcast awaiting publication."""
+
+    message: GroupReplayStartMessage | GroupReplayStopMessage
+    message_id: str
+    sender: str
+
+    def to_dict(self) -> Dict[str, object]:
+        return self.message.to_dict()
+
+    def headers(self) -> Dict[str, str]:
+        return {"X-Command-Sender": self.sender, "Nats-Msg-Id": self.message_id}
+
 
 class CommandSender:
     """Publish display commands to JetStream-compatible publishers."""
@@ -58,12 +76,48 @@ class CommandSender:
 
     def _publish(self, subject: str, payload: CommandPayload) -> CommandPayload:
         encoded = cbor2.dumps(payload.to_dict())
-        headers = {"Nats-Msg-Id": payload.cmd_id}
-        result = self._publisher.publish(subject, encoded, headers=headers, timestamp=time.time())
+        result = self._publisher.publish(
+            subject, encoded, headers=payload.headers(), timestamp=time.time()
+        )
         if result is False:
             raise RuntimeError(f"Failed to publish command {payload.cmd_id}")
         return payload
 
+    def send_batch(
+        self, commands: Sequence[Tuple[str, CommandPayload | OpsControlCommand]]
+    ) -> List[CommandPayload | OpsControlCommand]:
+        """Publish several prepared ``(subject, payload)`` commands together.
+
+        Display commands and operations control broadcasts (see
+        :class:`OpsControlSender`) may be mixed. Publishers exposing
+        ``publish_many`` receive the whole batch at once so the
+        acknowledgements are awaited concurrently; other publishers fall back
+        to one ``publish`` call per command. Every command is attempted before
+        failures are reported.
+        """
+
+        messages = [
+            (subject, cbor2.dumps(payload.to_dict()), payload.headers())
+            for subject, payload in commands
+        ]
+        timestamp = time.time()
+        publish_many = getattr(self._publisher, "publish_many", None)
+        if publish_many is None:
+            results = [
+                self._publisher.publish(subject, data, headers=headers, timestamp=timestamp)
+                for subject, data, headers in messages
+            ]
+        else:
+            results = publish_many(messages, timestamp=timestamp)
+        failed = [
+            headers["Nats-Msg-Id"]
+            for (_, _, headers), result in zip(messages, results)
+            if result is False
+        ]
+        if failed:
+            raise RuntimeError(f"Failed to publish commands {', '.join(failed)}")
+        return [payload for _, payload in commands]
+
     def _build(self, name: str, body: Dict[str, object]) -> CommandPayload:
         return CommandPayload(
             cmd_id=str(uuid.uuid4()),
@@ -73,30 +127,43 @@ class CommandSender:
             payload=body,
         )
 
-    def send_units(self, units: str) -> CommandPayload:
-        """Publish a units command."""
+    def units_command(self, units: str) -> Tuple[str, CommandPayload]:
+        """Validate and build a units command without publishing it."""
 
         normalized = units.lower()
         if normalized not in {"metric", "imperial"}:
             raise ValueError("Units must be 'metric' or 'imperial'")
         payload = self._build("display.units", {"units": normalized})
-        subject = f"{COMMAND_SUBJECT_PREFIX}.units"
-        return self._publish(subject, payload)
+        return f"{COMMAND_SUBJECT_PREFIX}.units", payload
 
-    def send_marker_color(self, color: str) -> CommandPayload:
-        """Publish a marker color command."""
+    def send_units(self, units: str) -> CommandPayload:
+        """Publish a units command."""
+
+        return self._publish(*self.units_command(units))
+
+    def marker_color_command(self, color: str) -> Tuple[str, CommandPayload]:
+        """Validate and build a marker color command without publishing it."""
 
         if not color:
             raise ValueError("Color must be a non-empty string")
         normalized = color.strip()
         body = {"marker_color": normalized}
         payload = self._build("display.marker_color", body)
-        subject = f"{COMMAND_SUBJECT_PREFIX}.marker_color"
-        return self._publish(subject, payload)
+        return f"{COMMAND_SUBJECT_PREFIX}.marker_color", payload
+
+    def send_marker_color(self, color: str) -> CommandPayload:
+        """Publish a marker color command."""
+
+        return self._publish(*self.marker_color_command(color))
 
     def send_session_metadata(self, name: str, identifier: str) -> CommandPayload:
         """Broadcast operator-selected session metadata to all receivers."""
 
+        return self._publish(*self.session_metadata_command(name, identifier))
+
+    def session_metadata_command(self, name: str, identifier: str) -> Tuple[str, CommandPayload]:
+        """Validate and build a session metadata command without publishing it."""
+
         if not isinstance(name, str) or not name.strip():
             raise ValueError("Session name must be a non-empty string")
         if not isinstance(identifier, str):
@@ -108,8 +175,7 @@ class CommandSender:
         normalized_id = identifier.strip()
         body = {"session_metadata": {"name": normalized_name, "id": normalized_id}}
         payload = self._build("display.session_metadata", body)
-        subject = f"{COMMAND_SUBJECT_PREFIX}.session_metadata"
-        return self._publish(subject, payload)
+        return f"{COMMAND_SUBJECT_PREFIX}.session_metadata", payload
 
 
 class OpsControlSender:
@@ -120,45 +186,76 @@ class OpsControlSender:
         self._sender_id = sender_id
         self._active_channel_id: Optional[str] = None
 
-    def _publish(self, payload: Dict[str, object], *, message_id: Optional[str] = None) -> Dict[str, object]:
-        headers = {"X-Command-Sender": self._sender_id}
-        if message_id:
-            headers["Nats-Msg-Id"] = message_id
-        encoded = cbor2.dumps(payload)
+    def _publish(self, command: OpsControlCommand) -> None:
         result = self._publisher.publish(
             OPS_CONTROL_SUBJECT,
-            encoded,
-            headers=headers,
+            cbor2.dumps(command.to_dict()),
+            headers=command.headers(),
             timestamp=time.time(),
         )
         if result is False:
             raise RuntimeError("Failed to publish operations command")
-        return payload
+        self.commit(command)
 
-    def start_group_replay(
+    def commit(self, command: OpsControlCommand) -> None:
+        """Move the active channel to reflect a broadcast that was sent.
+
+        Commands built with the ``*_command`` helpers and published elsewhere
+        (for example through :meth:`CommandSender.send_batch`) must be
+        committed once the send succeeds; a broadcast that never went out
+        leaves the active channel untouched.
+        """
+
+        message = command.message
+        if isinstance(message, GroupReplayStartMessage):
+            self._active_channel_id = message.channel.channel_id
+        elif isinstance(message, GroupReplayStopMessage):
+            if self._active_channel_id == message.channel_id:
+                self._active_channel_id = None
+
+    def start_group_replay_command(
         self,
         identifier,
         *,
         stream: str = TSPI_STREAM,
         display_name: Optional[str] = None,
-    ) -> GroupReplayStartMessage:
+    ) -> Tuple[str, OpsControlCommand]:
+        """Build a group replay start broadcast without publishing it."""
+
         channel = group_replay_channel(identifier, stream=stream, display_name=display_name)
-        message = GroupReplayStartMessage(channel)
         message_id = f"{channel.channel_id}:start:{uuid.uuid4()}"
-        self._publish(message.to_dict(), message_id=message_id)
-        self._active_channel_id = channel.channel_id
-        return message
+        command = OpsControlCommand(GroupReplayStartMessage(channel), message_id, self._sender_id)
+        return OPS_CONTROL_SUBJECT, command
+
+    def start_group_replay(
+        self,
+        identifier,
+        *,
+        stream: str = TSPI_STREAM,
+        display_name: Optional[str] = None,
+    ) -> GroupReplayStartMessage:
+        _, command = self.start_group_replay_command(
+            identifier, stream=stream, display_name=display_name
+        )
+        self._publish(command)
+        return command.message
+
+    def stop_group_replay_command(
+        self, channel_id: Optional[str] = None
+    ) -> Tuple[str, OpsControlCommand]:
+        """Build a group replay stop broadcast without publishing it."""
 
-    def stop_group_replay(self, channel_id: Optional[str] = None) -> GroupReplayStopMessage:
         resolved = channel_id or self._active_channel_id
         if not resolved:
             raise ValueError("Group replay channel_id is required to stop a replay")
-        message = GroupReplayStopMessage(resolved)
         message_id = f"{resolved}:stop:{uuid.uuid4()}"
-        self._publish(message.to_dict(), message_id=message_id)
-        if self._active_channel_id == resolved:
-            self._active_channel_id = None
-        return message
+        command = OpsControlCommand(GroupReplayStopMessage(resolved), message_id, self._sender_id)
+        return OPS_CONTROL_SUBJECT, command
+
+    def stop_group_replay(self, channel_id: Optional[str] = None) -> GroupReplayStopMessage:
+        _, command = self.stop_group_replay_command(channel_id)
+        self._publish(command)
+        return command.message
 
     @property
     def active_channel_id(self) -> Optional[str]:
@@ -169,6 +266,7 @@ __all__ = [
     "CommandSender",
     "COMMAND_SUBJECT_PREFIX",
     "CommandPayload",
+    "OpsControlCommand",
     "OpsControlSender",
     "OPS_CONTROL_SUBJECT",
 ]
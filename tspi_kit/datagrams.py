@@ -3,12 +3,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Literal
+from typing import Callable, Dict, Literal, Tuple
 import struct
 
 _DATAGRAM_LENGTH = 37
 _HEADER_FORMAT = ">BBHHIBH"
 _HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+# Sensor id sits after the type and version bytes of the header.
+_SENSOR_ID = struct.Struct(">H")
+_SENSOR_ID_OFFSET = 2
 _PAYLOAD_SIZE = _DATAGRAM_LENGTH - _HEADER_SIZE
 
 _GEOCENTRIC_FORMAT = ">iii hhh hhh".replace(" ", "")
@@ -50,7 +53,7 @@ class ParsedTSPI:
         return f"{self.sensor_id}:{self.day}:{time_s_value}"
 
 
-def _unpack_header(datagram: bytes) -> tuple[MessageType, int, int, int, int, int, int]:
+def _unpack_header(datagram: bytes) -> tuple[int, int, int, int, int, int, int]:
     if len(datagram) != _DATAGRAM_LENGTH:
         raise ValueError(
             f"TSPI datagram must be exactly {_DATAGRAM_LENGTH} bytes; received {len(datagram)}"
@@ -66,11 +69,22 @@ def _unpack_header(datagram: bytes) -> tuple[MessageType, int, int, int, int, in
         status_flags,
     ) = struct.unpack(_HEADER_FORMAT, datagram[:_HEADER_SIZE])
 
-    message_type = MessageType.from_byte(message_type_byte)
+    if message_type_byte not in _PAYLOAD_PARSERS:
+        raise ValueError(f"Unsupported message type byte: 0x{message_type_byte:02x}")
     if version != 4:
         raise ValueError(f"Unsupported datagram version: {version}")
 
-    return message_type, version, sensor_id, day, time_ticks, status, status_flags
+    return message_type_byte, version, sensor_id, day, time_ticks, status, status_flags
+
+
+def peek_sensor_id(datagram: bytes) -> int:
+    """Return the sensor id of *datagram* without parsing the rest of it."""
+
+    if len(datagram) != _DATAGRAM_LENGTH:
+        raise ValueError(
+            f"TSPI datagram must be exactly {_DATAGRAM_LENGTH} bytes; received {len(datagram)}"
+        )
+    return _SENSOR_ID.unpack_from(datagram, _SENSOR_ID_OFFSET)[0]
 
 
 def _status_bits(status: int, status_flags: int) -> Dict[str, bool]:
@@ -148,11 +162,19 @@ def _parse_spherical(payload: bytes) -> Dict[str, float]:
     }
 
 
+# Message type byte -> (type label, payload parser). Dispatching on the raw
+# byte avoids constructing a ``MessageType`` and an if-chain per datagram.
+_PAYLOAD_PARSERS: Dict[int, Tuple[Literal["geocentric", "spherical"], Callable[[bytes], Dict[str, float]]]] = {
+    MessageType.GEOCENTRIC.value: ("geocentric", _parse_geocentric),
+    MessageType.SPHERICAL.value: ("spherical", _parse_spherical),
+}
+
+
 def parse_tspi_datagram(datagram: bytes) -> ParsedTSPI:
     """Parse a binary TSPI datagram into a :class:`ParsedTSPI` instance."""
 
     (
-        message_type,
+        message_type_byte,
         version,
         sensor_id,
         day,
@@ -161,37 +183,15 @@ def parse_tspi_datagram(datagram: bytes) -> ParsedTSPI:
         status_flags,
     ) = _unpack_header(datagram)
 
-    payload = datagram[_HEADER_SIZE:]
-    time_s = time_ticks / 10_000.0
-    status_mapping = _status_bits(status, status_flags)
-
-    if message_type is MessageType.GEOCENTRIC:
-        parsed_payload = _parse_geocentric(payload)
-        return ParsedTSPI(
-            type="geocentric",
-            sensor_id=sensor_id,
-            day=day,
-            time_s=time_s,
-            time_ticks=time_ticks,
-            status=status,
-            status_flags=status_mapping,
-            payload=parsed_payload,
-            version=version,
-        )
-
-    if message_type is MessageType.SPHERICAL:
-        parsed_payload = _parse_spherical(payload)
-        return ParsedTSPI(
-            type="spherical",
-            sensor_id=sensor_id,
-            day=day,
-            time_s=time_s,
-            time_ticks=time_ticks,
-            status=status,
-            status_flags=status_mapping,
-            payload=parsed_payload,
-            version=version,
-        )
-
-    # Should not reach here because unsupported types are handled earlier.
-    raise AssertionError("Unhandled message type")
+    message_type, parse_payload = _PAYLOAD_PARSERS[message_type_byte]
+    return ParsedTSPI(
+        type=message_type,
+        sensor_id=sensor_id,
+        day=day,
+        time_s=time_ticks / 10_000.0,
+        time_ticks=time_ticks,
+        status=status,
+        status_flags=_status_bits(status, status_flags),
+        payload=parse_payload(datagram[_HEADER_SIZE:]),
+        version=version,
+    )
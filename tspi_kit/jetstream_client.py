@@ -3,19 +3,31 @@ from __future__ import annotations
 
 import asyncio
 import threading
-import time
 from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence
+from typing import Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from nats import errors as nats_errors
 from nats.aio.client import Client as NATS
+from nats.js.api import AckPolicy, ConsumerConfig
+from nats.js.errors import NotFoundError
+
+try:  # pragma: no cover - optional dependency resolution
+    import uvloop
+except ModuleNotFoundError:  # pragma: no cover - fall back to the stdlib loop
+    uvloop = None  # type: ignore[assignment]
 
 ErrNoServers = getattr(nats_errors, "ErrNoServers", nats_errors.NoServersError)
 TimeoutError = getattr(
     nats_errors, "TimeoutError", getattr(nats_errors, "ErrTimeout", asyncio.TimeoutError)
 )
 
+# Retries against a server or stream that is still coming up back off
+# exponentially: quick first retries catch the common short race, the cap
+# keeps long waits from hammering the server.
+_RETRY_INITIAL_DELAY = 0.025
+_RETRY_MAX_DELAY = 1.0
+
 
 def normalize_stream_subjects(subjects: Sequence[str]) -> List[str]:
     """Remove redundant subjects that are already covered by broader wildcards."""
@@ -45,8 +57,6 @@ def normalize_stream_subjects(subjects: Sequence[str]) -> List[str]:
             normalized.append(subject)
     return normalized
 
-from nats.js.errors import NotFoundError
-
 
 class JetStreamPublisherAdapter:
     """Adapter exposing a synchronous ``publish`` API backed by JetStream."""
@@ -64,6 +74,34 @@ class JetStreamPublisherAdapter:
         except Exception:  # pragma: no cover - surfaced to caller
             return False
 
+    def publish_many(
+        self,
+        messages: Sequence[tuple[str, bytes, Optional[Mapping[str, str]]]],
+        *,
+        timestamp=None,
+    ) -> List[bool]:
+        """Publish ``(subject, payload, headers)`` tuples and await all acks together."""
+
+        if not messages:
+            return []
+        future = asyncio.run_coroutine_threadsafe(self._publish_all(messages), self._loop)
+        try:
+            results = future.result(timeout=5)
+        except Exception:  # pragma: no cover - surfaced to caller
+            return [False] * len(messages)
+        return [not isinstance(result, BaseException) for result in results]
+
+    async def _publish_all(
+        self, messages: Sequence[tuple[str, bytes, Optional[Mapping[str, str]]]]
+    ) -> list:
+        return await asyncio.gather(
+            *(
+                self._js.publish(subject, payload, headers=headers)
+                for subject, payload, headers in messages
+            ),
+            return_exceptions=True,
+        )
+
 
 @dataclass
 class _AckingMessage:
@@ -72,32 +110,62 @@ class _AckingMessage:
     data: bytes
 
 
+async def _ack_all(messages: Sequence) -> None:
+    await asyncio.gather(*(message.ack() for message in messages), return_exceptions=True)
+
+
 class JetStreamConsumerAdapter:
-    """Expose JetStream pull subscriptions via a synchronous ``pull`` API."""
+    """Expose JetStream pull subscriptions via a synchronous ``pull`` API.
 
-    def __init__(self, loop: asyncio.AbstractEventLoop, subscription) -> None:
+    Messages of each fetched batch are acknowledged together with a single
+    hop onto the client loop, and only once the caller has received the
+    batch. Consumers with an ``AckNone`` policy pass ``ack=False`` and skip
+    acknowledgements entirely.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, subscription, *, ack: bool = True) -> None:
         self._loop = loop
         self._subscription = subscription
+        self._ack = ack
 
     def pull(self, batch: int) -> List[_AckingMessage]:
-        coro = self._subscription.fetch(batch, timeout=1)
-        future: Future[Sequence] = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return self.finish_pull(self.start_pull(batch))
+
+    def start_pull(self, batch: int) -> Future[list]:
+        """Begin a pull on the client loop and return its pending result.
+
+        Callers reading several consumers start every pull before waiting on
+        any, so an idle subject's fetch timeout overlaps the others instead
+        of delaying them. Hand the result to :meth:`finish_pull`.
+        """
+
+        return asyncio.run_coroutine_threadsafe(self._fetch(batch), self._loop)
+
+    def finish_pull(self, pull: Future[list], timeout: float = 5) -> List[_AckingMessage]:
+        """Wait for *pull*, then acknowledge the batch the caller now holds.
+
+        A pull that does not complete within *timeout* is cancelled; anything
+        it fetched stays unacknowledged and is redelivered.
+        """
+
         try:
-            messages = future.result(timeout=5)
-        except TimeoutError:
-            return []
+            messages = pull.result(timeout=timeout)
         except Exception:  # pragma: no cover - surfaced to caller
+            pull.cancel()
             return []
-
-        results: List[_AckingMessage] = []
-        for message in messages:
-            results.append(_AckingMessage(data=message.data))
-            ack_future = asyncio.run_coroutine_threadsafe(message.ack(), self._loop)
+        if self._ack and messages:
+            ack_future = asyncio.run_coroutine_threadsafe(_ack_all(messages), self._loop)
             try:
-                ack_future.result(timeout=5)
+                ack_future.result(timeout=timeout)
             except Exception:  # pragma: no cover - diagnostics only
                 pass
-        return results
+        return [_AckingMessage(data=message.data) for message in messages]
+
+    async def _fetch(self, batch: int) -> list:
+        try:
+            return await self._subscription.fetch(batch, timeout=1)
+        except Exception:  # empty pulls surface as a fetch timeout
+            return []
 
     def pending(self) -> int:
         coro = self._subscription.consumer_info()
@@ -124,7 +192,10 @@ class JetStreamThreadedClient:
             raise ValueError("At least one NATS server must be provided")
         self._connect_timeout = connect_timeout
         self._reconnect_time_wait = reconnect_time_wait
-        self._loop = asyncio.new_event_loop()
+        # The background loop only services NATS sockets and callbacks, so use
+        # libuv's loop when uvloop is installed.
+        new_loop = uvloop.new_event_loop if uvloop is not None else asyncio.new_event_loop
+        self._loop = new_loop()
         self._thread = threading.Thread(target=self._run_loop, name="jetstream-client", daemon=True)
         self._nc: Optional[NATS] = None
         self._js = None
@@ -147,6 +218,7 @@ class JetStreamThreadedClient:
 
     async def _connect(self) -> None:
         deadline = self._loop.time() + 60.0
+        delay = _RETRY_INITIAL_DELAY
         attempt = 0
         last_error: Exception | None = None
         while True:
@@ -165,7 +237,8 @@ class JetStreamThreadedClient:
                 last_error = exc
                 if self._loop.time() >= deadline:
                     raise RuntimeError("Timed out connecting to NATS JetStream") from exc
-                await asyncio.sleep(1.0)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RETRY_MAX_DELAY)
 
         if last_error is not None:  # pragma: no cover - defensive
             raise last_error
@@ -220,24 +293,98 @@ class JetStreamThreadedClient:
         *,
         durable: str | None = None,
         stream: str | None = None,
+        ack_policy: str = "explicit",
     ) -> JetStreamConsumerAdapter:
+        """Create a pull consumer on *subject*.
+
+        ``ack_policy="none"`` creates an ``AckNone`` consumer for loss-tolerant
+        traffic such as status heartbeats, so pulls never wait on acks. An
+        existing durable keeps its own policy and is acknowledged accordingly.
+        """
+
+        return self.create_pull_consumers([(subject, durable, stream)], ack_policy=ack_policy)[0]
+
+    def create_pull_consumers(
+        self,
+        specs: Sequence[Tuple[str, str | None, str | None]],
+        *,
+        ack_policy: str = "explicit",
+    ) -> List[JetStreamConsumerAdapter]:
+        """Create one pull consumer per ``(subject, durable, stream)`` spec.
+
+        The subscriptions are requested concurrently on the client loop, so
+        wiring several consumers costs roughly one API round trip instead of
+        one per subject. Adapters are returned in *specs* order.
+        """
+
         if self._js is None:
             raise RuntimeError("JetStream client not started")
-        deadline = time.time() + 30.0
-        while True:
-            future = asyncio.run_coroutine_threadsafe(
-                self._js.pull_subscribe(subject, durable=durable, stream=stream),
-                self._loop,
+        policy = AckPolicy(ack_policy)
+        future = asyncio.run_coroutine_threadsafe(self._pull_subscribe_all(specs, policy), self._loop)
+        subscriptions = future.result(timeout=45)
+        return [
+            JetStreamConsumerAdapter(self._loop, subscription, ack=ack)
+            for subscription, ack in subscriptions
+        ]
+
+    async def _pull_subscribe_all(
+        self,
+        specs: Sequence[Tuple[str, str | None, str | None]],
+        ack_policy: AckPolicy,
+    ) -> list:
+        return await asyncio.gather(
+            *(
+                self._pull_subscribe(subject, durable=durable, stream=stream, ack_policy=ack_policy)
+                for subject, durable, stream in specs
             )
-            try:
-                subscription = future.result(timeout=10)
-            except Exception as exc:  # pragma: no cover - surfaced to caller
-                if isinstance(exc, NotFoundError) and time.time() < deadline:
-                    time.sleep(0.5)
-                    continue
-                raise
-            return JetStreamConsumerAdapter(self._loop, subscription)
+        )
 
+    async def _pull_subscribe(
+        self,
+        subject: str,
+        *,
+        durable: str | None,
+        stream: str | None,
+        ack_policy: AckPolicy,
+    ) -> Tuple[object, bool]:
+        """Subscribe to *subject* and report whether its messages need acks."""
+
+        assert self._js is not None
+        subscription = await self._pull_subscribe_with_retry(
+            subject, durable=durable, stream=stream, ack_policy=ack_policy
+        )
+        if ack_policy is AckPolicy.EXPLICIT:
+            return subscription, True
+        # A durable that already existed was bound as-is, so its configured
+        # policy (not the requested one) decides whether acks are needed.
+        info = await subscription.consumer_info()
+        return subscription, info.config.ack_policy != AckPolicy.NONE
+
+    async def _pull_subscribe_with_retry(
+        self,
+        subject: str,
+        *,
+        durable: str | None,
+        stream: str | None,
+        ack_policy: AckPolicy,
+    ):
+        assert self._js is not None
+        # The stream may still be propagating when a consumer is requested.
+        deadline = self._loop.time() + 30.0
+        delay = _RETRY_INITIAL_DELAY
+        while True:
+            # nats-py fills in the subject and names on the config it is
+            # given, so every attempt gets a fresh one.
+            config = None
+            if ack_policy is not AckPolicy.EXPLICIT:
+                config = ConsumerConfig(ack_policy=ack_policy)
+            try:
+                return await self._js.pull_subscribe(subject, durable=durable, stream=stream, config=config)
+            except NotFoundError:  # pragma: no cover - surfaced to caller once the deadline passes
+                if self._loop.time() >= deadline:
+                    raise
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RETRY_MAX_DELAY)
 
 __all__ = [
     "JetStreamConsumerAdapter",
@@ -1,18 +1,46 @@
 """Headless TSPI-to-JetStream producer for telemetry publishing."""
 from __future__ import annotations
 
+import asyncio
 import inspect
 from datetime import datetime, timezone
-from typing import Dict, Iterable, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
 import time
 
 import cbor2
 
-from .datagrams import ParsedTSPI, parse_tspi_datagram
+from .datagrams import ParsedTSPI, parse_tspi_datagram, peek_sensor_id
 from .jetstream import build_subject, message_headers
 
 
+class IngestBatchError(Exception):
+    """Report the datagrams of one :meth:`TSPIProducer.ingest_many_async` call that failed.
+
+    ``rejected`` pairs the batch index of every datagram that could not be
+    prepared with the exception raised, a :class:`ValueError` for malformed
+    input; ``failed`` pairs the index of every datagram whose publish raised
+    with that exception. ``payloads``
+    holds the per-datagram results, ``None`` wherever ingestion failed.
+    """
+
+    def __init__(
+        self,
+        rejected: List[Tuple[int, Exception]],
+        failed: List[Tuple[int, Exception]],
+        payloads: List[Optional[Dict[str, object]]],
+    ) -> None:
+        parts = []
+        if rejected:
+            parts.append(f"{len(rejected)} TSPI datagram(s) rejected")
+        if failed:
+            parts.append(f"{len(failed)} publish(es) failed")
+        super().__init__("; ".join(parts))
+        self.rejected = rejected
+        self.failed = failed
+        self.payloads = payloads
+
+
 class TSPIProducer:
     """Parse raw TSPI datagrams and publish CBOR payloads."""
 
@@ -25,9 +53,12 @@ class TSPIProducer:
     ) -> None:
         self._publisher = publisher
         self._stream_prefix = stream_prefix
-        self._allowed_sensors: Optional[Set[int]] = (
-            set(allowed_sensors) if allowed_sensors is not None else None
+        self._allowed_sensors: Optional[FrozenSet[int]] = (
+            frozenset(allowed_sensors) if allowed_sensors is not None else None
         )
+        # Subjects only depend on the message type and sensor id, so each is
+        # formatted once and looked up for every later datagram.
+        self._subjects: Dict[Tuple[str, int], str] = {}
 
     def _encode_payload(self, parsed: ParsedTSPI, recv_time: float) -> Dict[str, object]:
         recv_epoch_ms = int(round(recv_time * 1000))
@@ -48,13 +79,19 @@ class TSPIProducer:
     def _prepare_message(
         self, datagram: bytes, recv_time: float
     ) -> Optional[Tuple[str, Dict[str, str], bytes, Dict[str, object]]]:
-        parsed = parse_tspi_datagram(datagram)
-
-        if self._allowed_sensors is not None and parsed.sensor_id not in self._allowed_sensors:
+        allowed = self._allowed_sensors
+        # Filtered sensors are dropped on the raw header, before the payload
+        # and status flags are decoded.
+        if allowed is not None and peek_sensor_id(datagram) not in allowed:
             return None
 
+        parsed = parse_tspi_datagram(datagram)
+
         payload = self._encode_payload(parsed, recv_time)
-        subject = build_subject(parsed, stream_prefix=self._stream_prefix)
+        key = (parsed.type, parsed.sensor_id)
+        subject = self._subjects.get(key)
+        if subject is None:
+            subject = self._subjects[key] = build_subject(parsed, stream_prefix=self._stream_prefix)
         headers = message_headers(parsed)
         encoded = cbor2.dumps(payload)
         return subject, headers, encoded, payload
@@ -87,3 +124,54 @@ class TSPIProducer:
         if inspect.isawaitable(result):
             await result
         return payload
+
+    async def ingest_many_async(
+        self, datagrams: Sequence[Tuple[bytes, float]]
+    ) -> List[Optional[Dict[str, object]]]:
+        """Ingest ``(datagram, recv_time)`` pairs and await their publishes together.
+
+        Failures do not hold back the rest of the batch: a datagram that cannot
+        be prepared is skipped on its own and every publish is allowed to
+        settle. If anything went
+        wrong, a single :class:`IngestBatchError` listing each failure is
+        raised afterwards.
+        """
+
+        payloads: List[Optional[Dict[str, object]]] = []
+        pending: List[Tuple[int, object]] = []
+        rejected: List[Tuple[int, Exception]] = []
+        failed: List[Tuple[int, Exception]] = []
+        publish = self._publisher.publish
+        for index, (datagram, recv_time) in enumerate(datagrams):
+            payloads.append(None)
+            try:
+                message = self._prepare_message(datagram, recv_time)
+            except Exception as exc:
+                rejected.append((index, exc))
+                continue
+            if message is None:
+                continue
+            subject, headers, encoded, payload = message
+            try:
+                result = publish(subject, encoded, headers=headers, timestamp=recv_time)
+            except Exception as exc:
+                failed.append((index, exc))
+                continue
+            if inspect.isawaitable(result):
+                pending.append((index, result))
+            payloads[index] = payload
+
+        if pending:
+            results = await asyncio.gather(
+                *(result for _, result in pending), return_exceptions=True
+            )
+            for (index, _), result in zip(pending, results):
+                if isinstance(result, Exception):
+                    failed.append((index, result))
+                    payloads[index] = None
+                elif isinstance(result, BaseException):
+                    raise result
+        if rejected or failed:
+            failed.sort(key=lambda item: item[0])
+            raise IngestBatchError(rejected, failed, payloads)
+        return payloads
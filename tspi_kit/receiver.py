@@ -21,13 +21,22 @@ class TSPIReceiver:
         return "type" in payload and "sensor_id" in payload and "cmd_id" not in payload
 
     def fetch(self, batch: int = 1) -> List[dict]:
-        messages = self._consumer.pull(batch)
+        return self._decode(self._consumer.pull(batch))
+
+    def _decode(self, messages: Iterable) -> List[dict]:
+        # The schema validator is compiled once per process (see
+        # ``validate_payload``); the hot loop only binds it and the decoder
+        # as locals.
+        loads = cbor2.loads
+        validate = validate_payload if self._validate else None
+        is_telemetry = self._is_telemetry
         decoded: List[dict] = []
+        append = decoded.append
         for message in messages:
-            payload = cbor2.loads(message.data)
-            if self._validate and isinstance(payload, Mapping) and self._is_telemetry(payload):
-                validate_payload(payload)
-            decoded.append(payload)
+            payload = loads(message.data)
+            if validate is not None and isinstance(payload, Mapping) and is_telemetry(payload):
+                validate(payload)
+            append(payload)
         return decoded
 
     def fetch_all(self, batch_size: int = 50) -> List[dict]:
@@ -78,6 +87,16 @@ class CompositeTSPIReceiver:
         consumers = [getattr(receiver, "_consumer", None) for receiver in receivers]
         self._consumer = _PendingAggregator(consumers)
         self._sequence = 0
+        # JetStream consumers can start their pulls up front; when all of them
+        # can, every subject is fetched concurrently so an idle one cannot
+        # hold up the rest for its fetch timeout.
+        splittable = len(receivers) > 1 and all(
+            isinstance(receiver, TSPIReceiver)
+            and hasattr(consumer, "start_pull")
+            and hasattr(consumer, "finish_pull")
+            for receiver, consumer in zip(receivers, consumers)
+        )
+        self._split_consumers = consumers if splittable else None
 
     @staticmethod
     def _extract_timestamp(message: Mapping[str, object]) -> float | None:
@@ -92,10 +111,18 @@ class CompositeTSPIReceiver:
                 return None
         return None
 
+    def _fetch_each(self, batch: int) -> List[List[dict]]:
+        if self._split_consumers is None:
+            return [receiver.fetch(batch) for receiver in self._receivers]
+        pulls = [consumer.start_pull(batch) for consumer in self._split_consumers]
+        return [
+            receiver._decode(consumer.finish_pull(pull))
+            for receiver, consumer, pull in zip(self._receivers, self._split_consumers, pulls)
+        ]
+
     def fetch(self, batch: int = 1) -> List[dict]:
         annotated: List[tuple[float, int, dict]] = []
-        for receiver in self._receivers:
-            messages = receiver.fetch(batch)
+        for messages in self._fetch_each(batch):
             for message in messages:
                 if isinstance(message, Mapping):
                     timestamp = self._extract_timestamp(message)
@@ -4,7 +4,7 @@ from __future__ import annotations
 import json
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 from jsonschema import Draft202012Validator
 
@@ -18,13 +18,96 @@ def load_schema() -> Mapping[str, Any]:
     return json.loads(_SCHEMA_PATH.read_text("utf-8"))
 
 
+# JSON "number" excludes booleans even though ``bool`` subclasses ``int``, so
+# the fast path compares exact types instead of using ``isinstance``.
+_NUMBER_TYPES = frozenset({int, float})
+
+
 @lru_cache(maxsize=1)
 def _validator() -> Draft202012Validator:
+    """Return the process-wide validator compiled from :func:`load_schema`."""
+
     return Draft202012Validator(load_schema())
 
 
+def _compile_fast_validator(schema: Mapping[str, Any]) -> Callable[[Any], bool]:
+    """Return a straight-line checker for the fixed TSPI message shape.
+
+    The checker only answers ``True`` for payloads it can prove valid; anything
+    unusual (integral floats, out-of-range values, unknown keys) returns
+    ``False`` so the caller can defer to the full validator for the verdict
+    and its error message. Key sets come from *schema* so the two cannot drift.
+    """
+
+    definitions = schema["definitions"]
+    top_level_keys = frozenset(schema["required"])
+    flag_keys = frozenset(definitions["statusFlags"]["required"])
+    payload_keys = {
+        "geocentric": frozenset(definitions["geocentricPayload"]["required"]),
+        "spherical": frozenset(definitions["sphericalPayload"]["required"]),
+    }
+    number_types = _NUMBER_TYPES
+
+    def is_valid(payload: Any) -> bool:
+        if type(payload) is not dict or payload.keys() != top_level_keys:
+            return False
+        kind = payload["type"]
+        if type(kind) is not str:
+            return False
+        expected = payload_keys.get(kind)
+        if expected is None:
+            return False
+        sensor_id = payload["sensor_id"]
+        day = payload["day"]
+        time_s = payload["time_s"]
+        status = payload["status"]
+        recv_epoch_ms = payload["recv_epoch_ms"]
+        if not (
+            type(sensor_id) is int
+            and sensor_id >= 0
+            and type(day) is int
+            and 1 <= day <= 366
+            and type(time_s) in number_types
+            and time_s >= 0
+            and type(status) is int
+            and 0 <= status <= 255
+            and type(recv_epoch_ms) is int
+            and recv_epoch_ms >= 0
+            and type(payload["recv_iso"]) is str
+        ):
+            return False
+        flags = payload["status_flags"]
+        if type(flags) is not dict or flags.keys() != flag_keys:
+            return False
+        for value in flags.values():
+            if type(value) is not bool:
+                return False
+        body = payload["payload"]
+        if type(body) is not dict or body.keys() != expected:
+            return False
+        for value in body.values():
+            if type(value) not in number_types:
+                return False
+        return True
+
+    return is_valid
+
+
+@lru_cache(maxsize=1)
+def _fast_validator() -> Callable[[Any], bool]:
+    """Return the process-wide fast checker compiled from :func:`load_schema`."""
+
+    return _compile_fast_validator(load_schema())
+
+
 def validate_payload(payload: Mapping[str, Any]) -> None:
-    """Validate ``payload`` against the TSPI schema."""
+    """Validate ``payload`` against the TSPI schema.
+
+    Well-formed messages are accepted by a schema-specific fast check; only
+    payloads it cannot vouch for go through the generic ``jsonschema`` walk,
+    which raises the usual :class:`~jsonschema.ValidationError`.
+    """
 
-    validator = _validator()
-    validator.validate(payload)
+    if _fast_validator()(payload):
+        return
+    _validator().validate(payload)
@@ -6,6 +6,8 @@ import logging
 import time
 from typing import Optional
 
+from .producer import IngestBatchError
+
 
 class UDPIngestProtocol(asyncio.DatagramProtocol):
     """Receive UDP datagrams and hand them to a TSPI to JetStream producer."""
@@ -15,6 +17,7 @@ class UDPIngestProtocol(asyncio.DatagramProtocol):
         self._loop = loop or asyncio.get_running_loop()
         self._logger = logger or logging.getLogger(__name__)
         self._pending: set[asyncio.Task[None]] = set()
+        self._batch: list[tuple[bytes, float]] = []
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:  # pragma: no cover - logging only
         sockname = transport.get_extra_info("sockname")
@@ -30,10 +33,39 @@ class UDPIngestProtocol(asyncio.DatagramProtocol):
         self._logger.warning("UDP socket reported error: %s", exc)
 
     def datagram_received(self, data: bytes, addr) -> None:
-        recv_time = time.time()
-        task = self._loop.create_task(self._ingest(data, recv_time))
-        self._pending.add(task)
-        task.add_done_callback(self._pending.discard)
+        batch = self._batch
+        batch.append((data, time.time()))
+        if len(batch) == 1:
+            # Datagrams read before the task first runs (one selector wake-up
+            # usually drains several) join this batch instead of each paying
+            # for a task of their own.
+            task = self._loop.create_task(self._ingest_batch(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _ingest_batch(self, batch: list[tuple[bytes, float]]) -> None:
+        self._batch = []
+        ingest_many = getattr(self._producer, "ingest_many_async", None)
+        if ingest_many is None:
+            if len(batch) == 1:
+                await self._ingest(*batch[0])
+            else:
+                await asyncio.gather(*(self._ingest(*item) for item in batch))
+            return
+        try:
+            await ingest_many(batch)
+        except IngestBatchError as exc:
+            for index, error in exc.rejected:
+                if isinstance(error, ValueError):
+                    self._logger.warning(
+                        "Dropped malformed TSPI datagram (%d bytes): %s", len(batch[index][0]), error
+                    )
+                else:
+                    self._logger.error("Failed to ingest TSPI datagram: %s", error, exc_info=error)
+            for _, error in exc.failed:
+                self._logger.error("Failed to publish TSPI datagram: %s", error, exc_info=error)
+        except Exception:  # pragma: no cover - defensive logging
+            self._logger.exception("Failed to ingest TSPI datagram batch")
 
     async def _ingest(self, datagram: bytes, recv_time: float) -> None:
         try:
@@ -50,11 +82,20 @@ class UDPIngestProtocol(asyncio.DatagramProtocol):
 
 
 class AsyncJetStreamPublisher:
-    """Adapter that proxies publish calls to an async JetStream context."""
+    """Adapter that proxies publish calls to an async JetStream context.
+
+    Publishes from concurrent ingest batches overlap their server acks, but at
+    most ``max_inflight`` are outstanding at once; further callers wait for a
+    slot, which applies back-pressure instead of letting pending publishes
+    grow without bound.
+    """
 
-    def __init__(self, jetstream, *, publish_timeout: float = 2.0) -> None:
+    def __init__(self, jetstream, *, publish_timeout: float = 2.0, max_inflight: int = 512) -> None:
+        if max_inflight < 1:
+            raise ValueError("max_inflight must be at least 1")
         self._jetstream = jetstream
         self._publish_timeout = publish_timeout
+        self._inflight = asyncio.Semaphore(max_inflight)
 
     async def publish(
         self,
@@ -64,9 +105,10 @@ class AsyncJetStreamPublisher:
         headers: Optional[dict[str, str]] = None,
         timestamp: Optional[float] = None,  # noqa: ARG002 - kept for compatibility
     ) -> None:
-        await self._jetstream.publish(
-            subject,
-            payload,
-            headers=headers,
-            timeout=self._publish_timeout,
-        )
+        async with self._inflight:
+            await self._jetstream.publish(
+                subject,
+                payload,
+                headers=headers,
+                timeout=self._publish_timeout,
+            )
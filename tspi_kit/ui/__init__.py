@@ -1,11 +1,26 @@
 """Flet-based UI helpers for the TSPI tool suite."""
 
+from importlib import import_module
+from typing import Any
+
 from .config import UiConfig
-from .flet_app import JetStreamPlayerApp, PlayerViewConfig, mount_player
 from .map import MapSmoother, MapPreviewWidget
 from .player import JetStreamPlayerWindow, HeadlessPlayerRunner, PlayerState
 from .generator import GeneratorController
 
+# The Flet view pulls in the optional ``flet`` dependency, so it is only
+# imported when one of its exports is first requested (PEP 562).
+_FLET_APP_EXPORTS = frozenset({"JetStreamPlayerApp", "PlayerViewConfig", "mount_player"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _FLET_APP_EXPORTS:
+        value = getattr(import_module(".flet_app", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "UiConfig",
     "JetStreamPlayerApp",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
+from functools import cached_property, lru_cache
 from datetime import UTC, datetime, timedelta
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -93,13 +94,15 @@ class DataChunk:
     def label(self) -> str:
         return self.display_name or self.identifier
 
-    @property
+    @cached_property
     def duration_seconds(self) -> int:
+        # Chunks are immutable, so the span is computed once rather than on
+        # every slider offset conversion.
         return max(0, int((self.end - self.start).total_seconds()))
 
     def timestamp_at_offset(self, offset_seconds: int) -> datetime:
-        offset = max(0, offset_seconds)
-        clamped = min(offset, self.duration_seconds)
+        duration = self.duration_seconds
+        clamped = 0 if offset_seconds < 0 else duration if offset_seconds > duration else offset_seconds
         return self.start + timedelta(seconds=clamped)
 
     def offset_for_timestamp(self, timestamp: datetime) -> int:
@@ -133,14 +136,24 @@ def compose_replay_identifier(
 ) -> Tuple[str, str]:
     """Return a replay identifier and display label for the selected chunk/time."""
 
-    base = chunk.identifier
     if tag is not None:
-        identifier = f"{base} {tag.label}".strip()
-        display = f"{chunk.label} — {tag.label}".strip()
+        return _compose_replay_identifier(chunk.identifier, chunk.label, None, tag.label)
+    return _compose_replay_identifier(chunk.identifier, chunk.label, start_time, None)
+
+
+@lru_cache(maxsize=1024)
+def _compose_replay_identifier(
+    base: str, label: str, start_time: datetime | None, tag_label: str | None
+) -> Tuple[str, str]:
+    # Keyed on the primitive inputs so repeated selections of the same
+    # chunk/time skip the timestamp conversion and string building.
+    if tag_label is not None:
+        identifier = f"{base} {tag_label}".strip()
+        display = f"{label} — {tag_label}".strip()
     else:
         ts_iso = _isoformat(start_time)
         identifier = f"{base} {ts_iso}".strip()
-        display = f"{chunk.label} @ {ts_iso}".strip()
+        display = f"{label} @ {ts_iso}".strip()
     return identifier, display
 
 
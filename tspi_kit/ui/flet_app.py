@@ -20,6 +20,11 @@ from .map import MapPreviewWidget, MapSmoother
 from .player import PlayerMetrics, PlayerState, ReceiverFactory
 
 
+# Slider drags emit a change per tick; rate updates are coalesced over this
+# window so only the latest value is applied.
+_RATE_DEBOUNCE_SECONDS = 0.04
+
+
 @dataclass
 class PlayerViewConfig:
     """Configuration wrapper for the Flet view."""
@@ -85,6 +90,8 @@ class JetStreamPlayerApp:
             map_widget=self._map_widget,
         )
         self._loop_task: asyncio.Task[None] | None = None
+        self._pending_rate: float | None = None
+        self._rate_debounce: asyncio.TimerHandle | None = None
         self._build_controls(cfg)
         self._connect_signals()
         self.state.preload()
@@ -189,8 +196,18 @@ class JetStreamPlayerApp:
         await self.page.update_async()
 
     async def _on_rate_change(self, event: ft.ControlEvent) -> None:
-        self.state.set_rate(float(event.control.value))
-        await self.page.update_async()
+        self._pending_rate = float(event.control.value)
+        if self._rate_debounce is None:
+            self._rate_debounce = asyncio.get_running_loop().call_later(
+                _RATE_DEBOUNCE_SECONDS, self._apply_pending_rate
+            )
+
+    def _apply_pending_rate(self) -> None:
+        self._rate_debounce = None
+        rate, self._pending_rate = self._pending_rate, None
+        if rate is not None:
+            # ``set_rate`` republishes metrics, which refreshes the page.
+            self.state.set_rate(rate)
 
     async def _on_clock_change(self, event: ft.ControlEvent) -> None:
         self.state.set_clock_source(str(event.control.value))
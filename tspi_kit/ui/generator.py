@@ -5,6 +5,11 @@ import json
 from dataclasses import dataclass
 from typing import Optional
 
+try:  # pragma: no cover - optional dependency resolution
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
 from ..generator import FlightConfig, TSPIFlightGenerator
 from ..producer import TSPIProducer
 from .config import UiConfig
@@ -19,11 +24,14 @@ class GeneratorMetrics:
     rate: float = 0.0
 
     def to_json(self) -> str:
-        return json.dumps({
+        payload = {
             "frames_generated": self.frames_generated,
             "aircraft": self.aircraft,
             "rate": self.rate,
-        })
+        }
+        if orjson is not None:
+            return orjson.dumps(payload).decode()
+        return json.dumps(payload)
 
 
 class GeneratorController:
@@ -10,6 +10,11 @@ from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence
 
 from jsonschema import exceptions as jsonschema_exceptions
 
+try:  # pragma: no cover - optional dependency resolution
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
 from ..jetstream_sim import InMemoryJetStream
 from ..receiver import CompositeTSPIReceiver, TSPIReceiver
 from ..schema import validate_payload
@@ -34,17 +39,20 @@ class PlayerMetrics:
     timeline: int = 0
 
     def to_json(self) -> str:
-        return json.dumps(
-            {
-                "frames": self.frames,
-                "rate": self.rate,
-                "clock": self.clock,
-                "lag": self.lag,
-                "source": self.source,
-                "position": self.position,
-                "timeline": self.timeline,
-            }
-        )
+        payload = {
+            "frames": self.frames,
+            "rate": self.rate,
+            "clock": self.clock,
+            "lag": self.lag,
+            "source": self.source,
+            "position": self.position,
+            "timeline": self.timeline,
+        }
+        if orjson is not None:
+            # Metrics are emitted every interval in headless runs; orjson is
+            # several times faster than the stdlib encoder when installed.
+            return orjson.dumps(payload).decode()
+        return json.dumps(payload)
 
 
 class PlayerState:
@@ -280,7 +288,16 @@ class PlayerState:
         return False
 
     def set_rate(self, rate: float) -> None:
-        clamped = max(self._ui_config.rate_min, min(self._ui_config.rate_max, float(rate)))
+        value = rate if type(rate) is float else float(rate)
+        config = self._ui_config
+        if value < config.rate_min:
+            clamped = config.rate_min
+        elif value > config.rate_max:
+            clamped = config.rate_max
+        else:
+            clamped = value
+        if clamped == self._rate:
+            return
         self._rate = clamped
         self._metrics.rate = clamped
         self._emit_metrics(force=True)
@@ -310,17 +327,19 @@ class PlayerState:
     def set_source_mode(self, name: str) -> None:
         self.set_channel(name)
 
-    def step_once(self) -> None:
-        self._tick()
+    def step_once(self) -> float | None:
+        # Returns the ``time.monotonic()`` reading taken once the frame was
+        # handled (``None`` when no frame played) so callers can reuse it.
+        return self._tick()
 
-    def _tick(self) -> None:
+    def _tick(self) -> float | None:
         if not self._playing:
-            return
+            return None
         if self._position >= len(self._timeline):
             self.preload()
             if self._position >= len(self._timeline):
                 self.pause()
-                return
+                return None
         message = self._timeline[self._position]
         self._position += 1
         self._metrics.frames += 1
@@ -328,7 +347,7 @@ class PlayerState:
         self._metrics.timeline = len(self._timeline)
         self._handle_message(message)
         self._sideband_cursor = max(self._sideband_cursor, self._position)
-        self._emit_metrics()
+        return self._emit_metrics()
 
     def _handle_jump(self, previous: int, current: int) -> None:
         if current > previous:
@@ -408,7 +427,7 @@ class PlayerState:
                 ) * 0.01
                 self._map_widget.apply_position(center, zoom)
 
-    def _emit_metrics(self, *, force: bool = False) -> None:
+    def _emit_metrics(self, *, force: bool = False) -> float:
         now = time.monotonic()
         if force or now - self._last_metrics >= self._ui_config.metrics_interval:
             self._last_metrics = now
@@ -423,22 +442,12 @@ class PlayerState:
             self._metrics.lag = int(pending)
             self._metrics.timeline = len(self._timeline)
             self.metrics_updated.emit(self._metrics)
-
-
-class _SignalAdapter:
-    def __init__(self) -> None:
-        self._callbacks: List[Callable[..., None]] = []
-
-    def connect(self, callback: Callable[..., None]) -> None:
-        if callback not in self._callbacks:
-            self._callbacks.append(callback)
-
-    def emit(self, *args, **kwargs) -> None:
-        for callback in list(self._callbacks):
-            callback(*args, **kwargs)
+        return now
 
 
 class _Button:
+    __slots__ = ("_label", "_on_click")
+
     def __init__(self, label: str, on_click: Callable[[], None]) -> None:
         self._label = label
         self._on_click = on_click
@@ -455,6 +464,8 @@ class _Button:
 
 
 class _TextInput:
+    __slots__ = ("value",)
+
     def __init__(self) -> None:
         self.value = ""
 
@@ -466,14 +477,23 @@ class _TextInput:
 
 
 class _SpinBox:
+    __slots__ = ("_min", "_max", "_value", "valueChanged")
+
     def __init__(self, *, minimum: float, maximum: float, value: float) -> None:
         self._min = minimum
         self._max = maximum
         self._value = value
-        self.valueChanged = _SignalAdapter()
+        self.valueChanged: Signal[float] = Signal()
 
     def setValue(self, value: float) -> None:
-        clamped = max(self._min, min(self._max, value))
+        if value < self._min:
+            clamped = self._min
+        elif value > self._max:
+            clamped = self._max
+        else:
+            clamped = value
+        if clamped == self._value:
+            return
         self._value = clamped
         self.valueChanged.emit(clamped)
 
@@ -482,18 +502,19 @@ class _SpinBox:
 
 
 class _ComboBox:
+    __slots__ = ("_options", "_current", "currentTextChanged")
+
     def __init__(self, options: Sequence[str], current: str) -> None:
-        self._options = list(options)
+        # Insertion-ordered dict: keeps display order and O(1) membership.
+        self._options: Dict[str, None] = dict.fromkeys(options)
         self._current = current
-        self.currentTextChanged = _SignalAdapter()
+        self.currentTextChanged: Signal[str] = Signal()
 
     def addItems(self, options: Iterable[str]) -> None:
-        for option in options:
-            if option not in self._options:
-                self._options.append(option)
+        self._options.update(dict.fromkeys(options))
 
     def setCurrentText(self, value: str) -> None:
-        if value not in self._options:
+        if value not in self._options or value == self._current:
             return
         self._current = value
         self.currentTextChanged.emit(value)
@@ -506,6 +527,8 @@ class _ComboBox:
 
 
 class _Label:
+    __slots__ = ("_text",)
+
     def __init__(self, text: str) -> None:
         self._text = text
 
@@ -517,6 +540,8 @@ class _Label:
 
 
 class _ListItem:
+    __slots__ = ("_text", "_data")
+
     def __init__(self, text: str, data: Optional[str] = None) -> None:
         self._text = text
         self._data = data
@@ -529,21 +554,30 @@ class _ListItem:
 
 
 class _ListWidget:
+    __slots__ = ("_items", "_by_data")
+
     def __init__(self) -> None:
         self._items: List[_ListItem] = []
+        self._by_data: Dict[str, _ListItem] = {}
 
     def addItem(self, text: str) -> None:
         self._items.append(_ListItem(text))
 
-    def add_or_replace(self, text: str, tag_id: str) -> None:
+    def add_or_replace(self, text: str, tag_id: str) -> _ListItem:
         self.remove_by_data(tag_id)
-        self._items.append(_ListItem(text, tag_id))
+        item = _ListItem(text, tag_id)
+        self._items.append(item)
+        self._by_data[tag_id] = item
+        return item
 
     def clear(self) -> None:
         self._items.clear()
+        self._by_data.clear()
 
     def remove_by_data(self, tag_id: str) -> None:
-        self._items = [item for item in self._items if item.data() != tag_id]
+        item = self._by_data.pop(tag_id, None)
+        if item is not None:
+            self._items.remove(item)
 
     def count(self) -> int:
         return len(self._items)
@@ -552,7 +586,10 @@ class _ListWidget:
         return self._items[index]
 
     def takeItem(self, index: int) -> None:
-        del self._items[index]
+        item = self._items.pop(index)
+        data = item.data()
+        if data is not None and self._by_data.get(data) is item:
+            del self._by_data[data]
 
 
 class JetStreamPlayerWindow:
@@ -608,7 +645,9 @@ class JetStreamPlayerWindow:
         if isinstance(sources, TSPIReceiver) or callable(sources):
             return {"livestream": sources}
         if hasattr(sources, "items"):
-            return dict(sources)  # type: ignore[return-value]
+            # ``PlayerState`` builds its own normalised dict from ``items()``,
+            # so there is no need to copy the caller's mapping here first.
+            return sources  # type: ignore[return-value]
         raise TypeError("Unsupported sources object for JetStreamPlayerWindow")
 
     def _toggle_play(self) -> None:
@@ -653,9 +692,7 @@ class JetStreamPlayerWindow:
             self._tag_items.pop(tag_id, None)
             self._tag_list.remove_by_data(tag_id)
         else:
-            item = _ListItem(summary, tag_id)
-            self._tag_items[tag_id] = item
-            self._tag_list.add_or_replace(summary, tag_id)
+            self._tag_items[tag_id] = self._tag_list.add_or_replace(summary, tag_id)
 
     @staticmethod
     def _extract_timestamp(message: Mapping[str, object]) -> str:
@@ -714,8 +751,11 @@ class HeadlessPlayerRunner:
     def run(self) -> None:
         self._state.start()
         while True:
-            self._state.step_once()
-            now = time.monotonic()
+            # The state reads the clock after handling the frame (including
+            # any blocking preload); reuse that reading for the checks below.
+            now = self._state.step_once()
+            if now is None:
+                now = time.monotonic()
             if self._duration is not None and now - self._start_time >= self._duration:
                 break
             if self._exit_on_idle is not None and now - self._last_activity >= self._exit_on_idle:
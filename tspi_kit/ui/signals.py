@@ -1,7 +1,7 @@
 """Lightweight signal helper used by the Flet UI and tests."""
 from __future__ import annotations
 
-from typing import Callable, Generic, Iterable, List, TypeVar
+from typing import Callable, Generic, Iterable, Tuple, TypeVar
 
 T = TypeVar("T")
 
@@ -11,30 +11,55 @@ class Signal(Generic[T]):
 
     The implementation intentionally mirrors the small subset of the
     previously-used ``pyqtSignal`` API that the project relied on. Subscribers
-    are stored as a simple list of callables and invoked synchronously when
-    ``emit`` is called. ``connect`` ignores duplicate registrations to keep
-    behaviour predictable in tests.
+    are stored as an immutable tuple that is rebuilt on ``connect`` and
+    ``disconnect`` and invoked synchronously when ``emit`` is called, so
+    emitting never copies the subscriber list. ``connect`` ignores duplicate
+    registrations to keep behaviour predictable in tests.
     """
 
+    __slots__ = ("_subscribers",)
+
     def __init__(self) -> None:
-        self._subscribers: List[Callable[..., None]] = []
+        self._subscribers: Tuple[Callable[..., None], ...] = ()
 
     def connect(self, callback: Callable[..., None]) -> None:
         """Register *callback* to be invoked when the signal emits."""
 
         if callback not in self._subscribers:
-            self._subscribers.append(callback)
+            self._subscribers = (*self._subscribers, callback)
+
+    def disconnect(self, callback: Callable[..., None]) -> None:
+        """Unregister *callback*; unknown callbacks are ignored."""
+
+        if callback in self._subscribers:
+            self._subscribers = tuple(
+                subscriber for subscriber in self._subscribers if subscriber != callback
+            )
 
     def emit(self, *args, **kwargs) -> None:
         """Invoke every subscribed callback with ``*args`` and ``**kwargs``."""
 
-        for subscriber in list(self._subscribers):
+        subscribers = self._subscribers
+        if not kwargs:
+            # Most emissions carry zero or one positional value; dispatch those
+            # without re-packing the argument tuple for every subscriber.
+            count = len(args)
+            if count == 0:
+                for subscriber in subscribers:
+                    subscriber()
+                return
+            if count == 1:
+                value = args[0]
+                for subscriber in subscribers:
+                    subscriber(value)
+                return
+        for subscriber in subscribers:
             subscriber(*args, **kwargs)
 
     def subscribers(self) -> Iterable[Callable[..., None]]:
         """Return the registered callbacks (useful for testing)."""
 
-        return tuple(self._subscribers)
+        return self._subscribers
 
 
 __all__ = ["Signal"]